@@ -178,7 +178,8 @@ async def get_activity_track(
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    if not activity.raw_fit_data:
+    raw_fit_data = repo.get_raw_fit_data(activity_id)
+    if not raw_fit_data:
         return ActivityTrackResponse(
             activity_id=activity_id,
             has_track=False,
@@ -187,7 +188,7 @@ async def get_activity_track(
 
     # Decompress and parse the raw FIT data
     try:
-        json_str = gzip.decompress(activity.raw_fit_data).decode("utf-8")
+        json_str = gzip.decompress(raw_fit_data).decode("utf-8")
         raw_data = json.loads(json_str)
     except (gzip.BadGzipFile, json.JSONDecodeError):
         return ActivityTrackResponse(
@@ -229,7 +230,8 @@ async def get_activity_streams(
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    if not activity.raw_fit_data:
+    raw_fit_data = repo.get_raw_fit_data(activity_id)
+    if not raw_fit_data:
         return ActivityStreamsResponse(
             activity_id=activity_id,
             timestamps=[],
@@ -238,7 +240,7 @@ async def get_activity_streams(
 
     # Decompress and parse the raw FIT data
     try:
-        json_str = gzip.decompress(activity.raw_fit_data).decode("utf-8")
+        json_str = gzip.decompress(raw_fit_data).decode("utf-8")
         raw_data = json.loads(json_str)
     except (gzip.BadGzipFile, json.JSONDecodeError):
         return ActivityStreamsResponse(
@@ -11,10 +11,11 @@ from sse_starlette.sse import EventSourceResponse
 
 from trainy.database import Repository
 from trainy.database.models import ActivityMetrics
-from trainy.metrics import calculate_tss
+from trainy.metrics import calculate_tss_batch
 from trainy.metrics.training_load import calculate_training_load
 from trainy.metrics.efficiency import calculate_efficiency_factor, calculate_variability_index
 from trainy.importers.fit_importer import (
+    read_fit_records,
     extract_power_samples_from_fit,
     calculate_all_peak_powers,
     extract_distance_time_series,
@@ -63,8 +64,10 @@ def calculate_activity_metrics_for_ids(
         rowing_efforts = {}
         if activity.activity_type in ("cycle", "row") and activity.fit_file_path:
             fit_path = Path(activity.fit_file_path)
-            power_samples, sample_interval = extract_power_samples_from_fit(fit_path)
-            if power_samples:
+            # Decode the file once for both power and distance extraction
+            records = read_fit_records(fit_path)
+            power_samples, sample_interval = extract_power_samples_from_fit(fit_path, records)
+            if len(power_samples):
                 include_rowing = activity.activity_type == "row"
                 peak_powers = calculate_all_peak_powers(
                     power_samples, include_rowing=include_rowing, sample_interval=sample_interval
@@ -72,8 +75,8 @@ def calculate_activity_metrics_for_ids(
 
             # Calculate rowing best efforts
             if activity.activity_type == "row":
-                series = extract_distance_time_series(fit_path)
-                if series:
+                series = extract_distance_time_series(fit_path, records)
+                if len(series):
                     rowing_efforts["rowing_500m_time"] = calculate_best_effort_time(series, 500)
                     rowing_efforts["rowing_1k_time"] = calculate_best_effort_time(series, 1000)
                     rowing_efforts["rowing_2k_time"] = calculate_best_effort_time(series, 2000)
@@ -272,9 +275,11 @@ async def recalculate_metrics(
     activities = repo.get_all_activities()
     activity_count = 0
 
-    for activity in activities:
-        # Calculate TSS
-        tss, method, intensity_factor = calculate_tss(activity, profile)
+    # Calculate TSS for all activities at once
+    tss_values, tss_methods, intensity_factors = calculate_tss_batch(activities, profile)
+    tss_rows = zip(tss_values.tolist(), tss_methods.tolist(), intensity_factors.tolist())
+
+    for activity, (tss, tss_method, intensity_factor) in zip(activities, tss_rows):
 
         # Calculate efficiency metrics
         ef = calculate_efficiency_factor(activity)
@@ -285,15 +290,17 @@ async def recalculate_metrics(
         rowing_efforts = {}
         if activity.activity_type in ("cycle", "row") and activity.fit_file_path:
             fit_path = Path(activity.fit_file_path)
-            power_samples, sample_interval = extract_power_samples_from_fit(fit_path)
-            if power_samples:
+            # Decode the file once for both power and distance extraction
+            records = read_fit_records(fit_path)
+            power_samples, sample_interval = extract_power_samples_from_fit(fit_path, records)
+            if len(power_samples):
                 include_rowing = activity.activity_type == "row"
                 peak_powers = calculate_all_peak_powers(power_samples, include_rowing=include_rowing, sample_interval=sample_interval)
 
             # Calculate rowing best efforts
             if activity.activity_type == "row":
-                series = extract_distance_time_series(fit_path)
-                if series:
+                series = extract_distance_time_series(fit_path, records)
+                if len(series):
                     # Distance PRs: best time to cover each distance
                     rowing_efforts["rowing_500m_time"] = calculate_best_effort_time(series, 500)
                     rowing_efforts["rowing_1k_time"] = calculate_best_effort_time(series, 1000)
@@ -312,7 +319,7 @@ async def recalculate_metrics(
         metrics = ActivityMetrics(
             activity_id=activity.id,
             tss=tss,
-            tss_method=method.value,
+            tss_method=tss_method,
             intensity_factor=intensity_factor,
             efficiency_factor=ef,
             variability_index=vi,
@@ -396,10 +403,12 @@ async def recalculate_generator(repo: Repository) -> AsyncIterator[dict]:
     }
     await asyncio.sleep(0)
 
+    # Calculate TSS for all activities at once
+    tss_values, tss_methods, intensity_factors = calculate_tss_batch(activities, profile)
+    tss_rows = zip(tss_values.tolist(), tss_methods.tolist(), intensity_factors.tolist())
+
     # Phase 1: Process activities (TSS, EF, VI, Peak Powers)
-    for i, activity in enumerate(activities, 1):
-        # Calculate TSS
-        tss, method, intensity_factor = calculate_tss(activity, profile)
+    for i, (activity, (tss, tss_method, intensity_factor)) in enumerate(zip(activities, tss_rows), 1):
 
         # Calculate efficiency metrics
         ef = calculate_efficiency_factor(activity)
@@ -410,15 +419,17 @@ async def recalculate_generator(repo: Repository) -> AsyncIterator[dict]:
         rowing_efforts = {}
         if activity.activity_type in ("cycle", "row") and activity.fit_file_path:
             fit_path = Path(activity.fit_file_path)
-            power_samples, sample_interval = extract_power_samples_from_fit(fit_path)
-            if power_samples:
+            # Decode the file once for both power and distance extraction
+            records = read_fit_records(fit_path)
+            power_samples, sample_interval = extract_power_samples_from_fit(fit_path, records)
+            if len(power_samples):
                 include_rowing = activity.activity_type == "row"
                 peak_powers = calculate_all_peak_powers(power_samples, include_rowing=include_rowing, sample_interval=sample_interval)
 
             # Calculate rowing best efforts
             if activity.activity_type == "row":
-                series = extract_distance_time_series(fit_path)
-                if series:
+                series = extract_distance_time_series(fit_path, records)
+                if len(series):
                     # Distance PRs: best time to cover each distance
                     rowing_efforts["rowing_500m_time"] = calculate_best_effort_time(series, 500)
                     rowing_efforts["rowing_1k_time"] = calculate_best_effort_time(series, 1000)
@@ -437,7 +448,7 @@ async def recalculate_generator(repo: Repository) -> AsyncIterator[dict]:
         metrics = ActivityMetrics(
             activity_id=activity.id,
             tss=tss,
-            tss_method=method.value,
+            tss_method=tss_method,
             intensity_factor=intensity_factor,
             efficiency_factor=ef,
             variability_index=vi,
@@ -10,7 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from trainy.config import settings
 from trainy.database import Repository
 from trainy.database.models import ActivityMetrics
-from trainy.importers import FitImporter, parse_fit_file, calculate_normalized_power
+from trainy.importers import FitImporter, calculate_normalized_power
 from trainy.metrics import calculate_tss, calculate_training_load
 from trainy.metrics.efficiency import calculate_efficiency_factor, calculate_variability_index
 
@@ -56,15 +56,13 @@ def main():
     skipped = 0
     failed = 0
 
-    for i, fit_file in enumerate(fit_files):
+    # FIT files are parsed in worker processes; results arrive in file order
+    for i, (fit_file, activity) in enumerate(importer.import_all(include_raw_data=False)):
         # Progress indicator
         if (i + 1) % 100 == 0 or (i + 1) == total_files:
             print(f"Processing: {i + 1}/{total_files} ({imported} imported, {skipped} skipped, {failed} failed)")
 
         try:
-            # Parse FIT file
-            activity = parse_fit_file(fit_file, include_raw_data=False)
-
             if activity is None:
                 failed += 1
                 continue
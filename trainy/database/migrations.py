@@ -1,9 +1,11 @@
 """Database schema and migrations."""
 
 import sqlite3
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 15
 
 SCHEMA = """
 -- Schema version tracking
@@ -45,17 +47,45 @@ CREATE TABLE IF NOT EXISTS activities (
     title TEXT,
     imported_at DATETIME DEFAULT CURRENT_TIMESTAMP,
 
-    raw_fit_data BLOB
+    -- Calendar day of start_time, computed by SQLite (indexed below)
+    start_date TEXT GENERATED ALWAYS AS (DATE(start_time)) VIRTUAL
 );
 
 CREATE INDEX IF NOT EXISTS idx_activities_start_time ON activities(start_time);
+CREATE INDEX IF NOT EXISTS idx_activities_start_date ON activities(start_date);
 CREATE INDEX IF NOT EXISTS idx_activities_type ON activities(activity_type);
+CREATE INDEX IF NOT EXISTS idx_activities_type_start ON activities(activity_type, start_time);
 CREATE INDEX IF NOT EXISTS idx_activities_hash ON activities(fit_file_hash);
 
--- Activity metrics - Computed values
+-- Activity blobs - Raw FIT data (gzip-compressed JSON), kept out of activities rows
+CREATE TABLE IF NOT EXISTS activity_blobs (
+    activity_id INTEGER PRIMARY KEY REFERENCES activities(id) ON DELETE CASCADE,
+    raw_fit_data BLOB
+);
+
+-- Activity counter - Maintained by triggers so counting is O(1)
+CREATE TABLE IF NOT EXISTS activity_counter (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    n INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO activity_counter (id, n) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_activities_count_insert
+AFTER INSERT ON activities
+BEGIN
+    UPDATE activity_counter SET n = n + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_activities_count_delete
+AFTER DELETE ON activities
+BEGIN
+    UPDATE activity_counter SET n = n - 1 WHERE id = 1;
+END;
+
+-- Activity metrics - Computed values, keyed by activity
 CREATE TABLE IF NOT EXISTS activity_metrics (
-    id INTEGER PRIMARY KEY,
-    activity_id INTEGER UNIQUE REFERENCES activities(id) ON DELETE CASCADE,
+    activity_id INTEGER PRIMARY KEY REFERENCES activities(id) ON DELETE CASCADE,
 
     tss REAL,
     tss_method TEXT,
@@ -91,9 +121,7 @@ CREATE TABLE IF NOT EXISTS activity_metrics (
     rowing_60min_distance REAL,
 
     calculated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-);
-
-CREATE INDEX IF NOT EXISTS idx_activity_metrics_activity ON activity_metrics(activity_id);
+) WITHOUT ROWID;
 
 -- Daily metrics - Rolling aggregates
 CREATE TABLE IF NOT EXISTS daily_metrics (
@@ -117,7 +145,17 @@ CREATE TABLE IF NOT EXISTS daily_metrics (
     -- Monotony & Strain (Foster method)
     monotony REAL,
     strain REAL
-);
+) WITHOUT ROWID;
+
+-- Rowing PR cache - Best value per rowing metric per day, refreshed on metric writes
+CREATE TABLE IF NOT EXISTS rowing_pr_cache (
+    day TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    best_value REAL NOT NULL,
+    sort_key REAL NOT NULL,
+    activity_id INTEGER REFERENCES activities(id) ON DELETE CASCADE,
+    PRIMARY KEY (day, metric)
+) WITHOUT ROWID;
 
 -- User profile - Threshold values
 CREATE TABLE IF NOT EXISTS user_profile (
@@ -187,6 +225,22 @@ CREATE TABLE IF NOT EXISTS workout_feedback (
 );
 
 CREATE INDEX IF NOT EXISTS idx_workout_feedback_activity ON workout_feedback(activity_id);
+CREATE INDEX IF NOT EXISTS idx_wf_pain ON workout_feedback(activity_id) WHERE has_pain = 1;
+CREATE INDEX IF NOT EXISTS idx_wf_location ON workout_feedback(pain_location)
+    WHERE has_pain = 1 AND pain_location IS NOT NULL;
+
+-- Pain rollup - Per-day pain feedback aggregates, derived from workout_feedback
+CREATE TABLE IF NOT EXISTS pain_rollup (
+    day TEXT NOT NULL,
+    activity_type TEXT,
+    pain_location TEXT,
+    count INTEGER NOT NULL,
+    severity_sum INTEGER,
+    severity_count INTEGER NOT NULL,
+    max_severity INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_pain_rollup_day ON pain_rollup(day);
 
 -- User settings for wellness tracking
 CREATE TABLE IF NOT EXISTS user_settings (
@@ -227,11 +281,140 @@ CREATE INDEX IF NOT EXISTS idx_morning_checkin_date ON morning_checkin(checkin_d
 """
 
 
+# Rowing metrics kept in rowing_pr_cache: (activity_metrics column, lower_is_better)
+ROWING_PR_METRICS = (
+    ("rowing_500m_time", True),
+    ("rowing_1k_time", True),
+    ("rowing_2k_time", True),
+    ("rowing_5k_time", True),
+    ("rowing_10k_time", True),
+    ("rowing_1min_distance", False),
+    ("rowing_4min_distance", False),
+    ("rowing_10min_distance", False),
+    ("rowing_20min_distance", False),
+    ("rowing_30min_distance", False),
+    ("rowing_60min_distance", False),
+    ("peak_power_1min", False),
+    ("peak_power_4min", False),
+    ("peak_power_30min", False),
+    ("peak_power_60min", False),
+)
+
+
+def _rowing_pr_cache_select(activity_filter: str) -> str:
+    """Build the SELECT producing the best value per day for every rowing PR metric.
+
+    sort_key is the value negated for higher-is-better metrics, so the best
+    entry of any metric is always the one with the lowest sort_key.
+    """
+    branches = []
+    for column, lower_is_better in ROWING_PR_METRICS:
+        order = "ASC" if lower_is_better else "DESC"
+        sort_key = f"m.{column}" if lower_is_better else f"-m.{column}"
+        branches.append(f"""
+            SELECT day, metric, best_value, sort_key, activity_id FROM (
+                SELECT DATE(a.start_time) AS day, '{column}' AS metric,
+                       m.{column} AS best_value, {sort_key} AS sort_key, a.id AS activity_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY DATE(a.start_time) ORDER BY m.{column} {order}
+                       ) AS rn
+                FROM activity_metrics m
+                JOIN activities a ON m.activity_id = a.id
+                WHERE a.activity_type = 'row'
+                  AND m.{column} IS NOT NULL
+                  {activity_filter}
+            )
+            WHERE rn = 1
+        """)
+    return " UNION ALL ".join(branches)
+
+
+def rebuild_rowing_pr_cache(conn: sqlite3.Connection, day: Optional[date] = None) -> None:
+    """Recompute rowing_pr_cache for a single day, or for all days if none given.
+
+    Does not commit; callers commit as part of their own write.
+    """
+    if day is None:
+        conn.execute("DELETE FROM rowing_pr_cache")
+        conn.execute(f"INSERT INTO rowing_pr_cache {_rowing_pr_cache_select('')}")
+        return
+
+    conn.execute("DELETE FROM rowing_pr_cache WHERE day = ?", (day.isoformat(),))
+    conn.execute(
+        f"""
+        INSERT INTO rowing_pr_cache
+        {_rowing_pr_cache_select("AND a.start_time >= :day AND a.start_time < :next_day")}
+        """,
+        {"day": day.isoformat(), "next_day": (day + timedelta(days=1)).isoformat()},
+    )
+
+
+_PAIN_ROLLUP_INSERT = """
+    INSERT INTO pain_rollup (
+        day, activity_type, pain_location,
+        count, severity_sum, severity_count, max_severity
+    )
+    SELECT DATE(a.start_time), a.activity_type, wf.pain_location,
+           COUNT(*), SUM(wf.pain_severity), COUNT(wf.pain_severity), MAX(wf.pain_severity)
+    FROM workout_feedback wf
+    JOIN activities a ON wf.activity_id = a.id
+    WHERE wf.has_pain = 1
+      {activity_filter}
+    GROUP BY DATE(a.start_time), a.activity_type, wf.pain_location
+"""
+
+
+def rebuild_pain_rollup(conn: sqlite3.Connection, day: Optional[date] = None) -> None:
+    """Recompute pain_rollup for a single day, or for all days if none given.
+
+    Does not commit; callers commit as part of their own write.
+    """
+    if day is None:
+        conn.execute("DELETE FROM pain_rollup")
+        conn.execute(_PAIN_ROLLUP_INSERT.format(activity_filter=""))
+        return
+
+    conn.execute("DELETE FROM pain_rollup WHERE day = ?", (day.isoformat(),))
+    conn.execute(
+        _PAIN_ROLLUP_INSERT.format(
+            activity_filter="AND a.start_time >= :day AND a.start_time < :next_day"
+        ),
+        {"day": day.isoformat(), "next_day": (day + timedelta(days=1)).isoformat()},
+    )
+
+
+def _convert_date(value: bytes) -> date:
+    """Convert a stored ISO date to a date."""
+    return date.fromisoformat(value.decode())
+
+
+def _convert_datetime(value: bytes) -> datetime:
+    """Convert a stored ISO timestamp to a datetime."""
+    return datetime.fromisoformat(value.decode())
+
+
+# Columns declared DATE / DATETIME are parsed by the driver at fetch time
+# (NULLs are passed through without calling the converter).
+sqlite3.register_converter("DATE", _convert_date)
+sqlite3.register_converter("DATETIME", _convert_datetime)
+
+
 def init_database(db_path: Path) -> sqlite3.Connection:
     """Initialize the database with schema if needed."""
-    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        cached_statements=256,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    # WAL lets readers proceed during writes; with WAL, NORMAL sync only
+    # fsyncs at checkpoints and stays corruption-safe
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
 
     # Check if we need to initialize
     cursor = conn.execute(
@@ -272,6 +455,30 @@ def _apply_migrations(conn: sqlite3.Connection, from_version: int, to_version: i
     if from_version < 7 <= to_version:
         _migrate_v6_to_v7(conn)
 
+    if from_version < 8 <= to_version:
+        _migrate_v7_to_v8(conn)
+
+    if from_version < 9 <= to_version:
+        _migrate_v8_to_v9(conn)
+
+    if from_version < 10 <= to_version:
+        _migrate_v9_to_v10(conn)
+
+    if from_version < 11 <= to_version:
+        _migrate_v10_to_v11(conn)
+
+    if from_version < 12 <= to_version:
+        _migrate_v11_to_v12(conn)
+
+    if from_version < 13 <= to_version:
+        _migrate_v12_to_v13(conn)
+
+    if from_version < 14 <= to_version:
+        _migrate_v13_to_v14(conn)
+
+    if from_version < 15 <= to_version:
+        _migrate_v14_to_v15(conn)
+
     conn.execute("INSERT INTO schema_version (version) VALUES (?)", (to_version,))
     conn.commit()
 
@@ -436,3 +643,217 @@ def _migrate_v6_to_v7(conn: sqlite3.Connection) -> None:
             conn.execute(f"ALTER TABLE activity_metrics ADD COLUMN {col} REAL")
         except sqlite3.OperationalError:
             pass  # Column already exists
+
+
+def _migrate_v7_to_v8(conn: sqlite3.Connection) -> None:
+    """Migration from v7 to v8: Add trigger-maintained activity counter."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS activity_counter (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            n INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        INSERT OR REPLACE INTO activity_counter (id, n)
+        SELECT 1, COUNT(*) FROM activities
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_activities_count_insert
+        AFTER INSERT ON activities
+        BEGIN
+            UPDATE activity_counter SET n = n + 1 WHERE id = 1;
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_activities_count_delete
+        AFTER DELETE ON activities
+        BEGIN
+            UPDATE activity_counter SET n = n - 1 WHERE id = 1;
+        END
+    """)
+
+
+def _migrate_v8_to_v9(conn: sqlite3.Connection) -> None:
+    """Migration from v8 to v9: Rebuild activity_metrics and daily_metrics as WITHOUT ROWID."""
+    # WITHOUT ROWID can't be toggled in place: create new tables, copy data, swap tables
+    conn.execute("DROP TABLE IF EXISTS activity_metrics_new")
+    conn.execute("""
+        CREATE TABLE activity_metrics_new (
+            activity_id INTEGER PRIMARY KEY REFERENCES activities(id) ON DELETE CASCADE,
+            tss REAL,
+            tss_method TEXT,
+            intensity_factor REAL,
+            efficiency_factor REAL,
+            variability_index REAL,
+            peak_power_5s REAL,
+            peak_power_1min REAL,
+            peak_power_5min REAL,
+            peak_power_20min REAL,
+            peak_power_4min REAL,
+            peak_power_30min REAL,
+            peak_power_60min REAL,
+            rowing_500m_time REAL,
+            rowing_1k_time REAL,
+            rowing_2k_time REAL,
+            rowing_5k_time REAL,
+            rowing_10k_time REAL,
+            rowing_1min_distance REAL,
+            rowing_4min_distance REAL,
+            rowing_10min_distance REAL,
+            rowing_20min_distance REAL,
+            rowing_30min_distance REAL,
+            rowing_60min_distance REAL,
+            calculated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        INSERT OR REPLACE INTO activity_metrics_new (
+            activity_id, tss, tss_method, intensity_factor,
+            efficiency_factor, variability_index,
+            peak_power_5s, peak_power_1min, peak_power_5min, peak_power_20min,
+            peak_power_4min, peak_power_30min, peak_power_60min,
+            rowing_500m_time, rowing_1k_time, rowing_2k_time, rowing_5k_time, rowing_10k_time,
+            rowing_1min_distance, rowing_4min_distance, rowing_10min_distance,
+            rowing_20min_distance, rowing_30min_distance, rowing_60min_distance,
+            calculated_at
+        )
+        SELECT
+            activity_id, tss, tss_method, intensity_factor,
+            efficiency_factor, variability_index,
+            peak_power_5s, peak_power_1min, peak_power_5min, peak_power_20min,
+            peak_power_4min, peak_power_30min, peak_power_60min,
+            rowing_500m_time, rowing_1k_time, rowing_2k_time, rowing_5k_time, rowing_10k_time,
+            rowing_1min_distance, rowing_4min_distance, rowing_10min_distance,
+            rowing_20min_distance, rowing_30min_distance, rowing_60min_distance,
+            calculated_at
+        FROM activity_metrics
+        WHERE activity_id IS NOT NULL
+    """)
+    conn.execute("DROP TABLE activity_metrics")
+    conn.execute("ALTER TABLE activity_metrics_new RENAME TO activity_metrics")
+
+    conn.execute("DROP TABLE IF EXISTS daily_metrics_new")
+    conn.execute("""
+        CREATE TABLE daily_metrics_new (
+            date DATE PRIMARY KEY,
+            total_tss REAL DEFAULT 0,
+            activity_count INTEGER DEFAULT 0,
+            total_duration_s REAL DEFAULT 0,
+            total_distance_m REAL DEFAULT 0,
+            ctl REAL,
+            atl REAL,
+            tsb REAL,
+            tss_7day REAL,
+            tss_30day REAL,
+            tss_90day REAL,
+            acwr REAL,
+            monotony REAL,
+            strain REAL
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        INSERT OR REPLACE INTO daily_metrics_new (
+            date, total_tss, activity_count, total_duration_s, total_distance_m,
+            ctl, atl, tsb, tss_7day, tss_30day, tss_90day,
+            acwr, monotony, strain
+        )
+        SELECT
+            date, total_tss, activity_count, total_duration_s, total_distance_m,
+            ctl, atl, tsb, tss_7day, tss_30day, tss_90day,
+            acwr, monotony, strain
+        FROM daily_metrics
+        WHERE date IS NOT NULL
+    """)
+    conn.execute("DROP TABLE daily_metrics")
+    conn.execute("ALTER TABLE daily_metrics_new RENAME TO daily_metrics")
+
+
+def _migrate_v9_to_v10(conn: sqlite3.Connection) -> None:
+    """Migration from v9 to v10: Move raw_fit_data out of activities into activity_blobs."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS activity_blobs (
+            activity_id INTEGER PRIMARY KEY REFERENCES activities(id) ON DELETE CASCADE,
+            raw_fit_data BLOB
+        )
+    """)
+
+    cursor = conn.execute("PRAGMA table_info(activities)")
+    columns = {row[1] for row in cursor.fetchall()}
+    if "raw_fit_data" not in columns:
+        return
+
+    conn.execute("""
+        INSERT OR REPLACE INTO activity_blobs (activity_id, raw_fit_data)
+        SELECT id, raw_fit_data FROM activities
+        WHERE raw_fit_data IS NOT NULL
+    """)
+    try:
+        conn.execute("ALTER TABLE activities DROP COLUMN raw_fit_data")
+    except sqlite3.OperationalError:
+        # SQLite < 3.35 can't drop columns; clear the data instead
+        conn.execute("UPDATE activities SET raw_fit_data = NULL")
+
+
+def _migrate_v10_to_v11(conn: sqlite3.Connection) -> None:
+    """Migration from v10 to v11: Add rowing_pr_cache and backfill it."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS rowing_pr_cache (
+            day TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            best_value REAL NOT NULL,
+            sort_key REAL NOT NULL,
+            activity_id INTEGER REFERENCES activities(id) ON DELETE CASCADE,
+            PRIMARY KEY (day, metric)
+        ) WITHOUT ROWID
+    """)
+    rebuild_rowing_pr_cache(conn)
+
+
+def _migrate_v11_to_v12(conn: sqlite3.Connection) -> None:
+    """Migration from v11 to v12: Add composite (activity_type, start_time) index."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_activities_type_start ON activities(activity_type, start_time)"
+    )
+
+
+def _migrate_v12_to_v13(conn: sqlite3.Connection) -> None:
+    """Migration from v12 to v13: Add partial indexes over pain feedback."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_wf_pain ON workout_feedback(activity_id) WHERE has_pain = 1"
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_wf_location ON workout_feedback(pain_location)
+        WHERE has_pain = 1 AND pain_location IS NOT NULL
+        """
+    )
+
+
+def _migrate_v13_to_v14(conn: sqlite3.Connection) -> None:
+    """Migration from v13 to v14: Add pain_rollup and backfill it."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS pain_rollup (
+            day TEXT NOT NULL,
+            activity_type TEXT,
+            pain_location TEXT,
+            count INTEGER NOT NULL,
+            severity_sum INTEGER,
+            severity_count INTEGER NOT NULL,
+            max_severity INTEGER
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pain_rollup_day ON pain_rollup(day)")
+    rebuild_pain_rollup(conn)
+
+
+def _migrate_v14_to_v15(conn: sqlite3.Connection) -> None:
+    """Migration from v14 to v15: Add generated start_date column to activities."""
+    # ALTER TABLE can only add VIRTUAL generated columns; the index stores the values
+    try:
+        conn.execute(
+            "ALTER TABLE activities ADD COLUMN start_date TEXT "
+            "GENERATED ALWAYS AS (DATE(start_time)) VIRTUAL"
+        )
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_activities_start_date ON activities(start_date)")
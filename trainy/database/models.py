@@ -47,7 +47,8 @@ class Activity(BaseModel):
     title: Optional[str] = None
     imported_at: Optional[datetime] = None
 
-    # Raw FIT data (gzip-compressed JSON)
+    # Raw FIT data (gzip-compressed JSON). Stored in activity_blobs and not
+    # loaded with the activity; use Repository.get_raw_fit_data to read it.
     raw_fit_data: Optional[bytes] = None
 
     # Joined from activity_metrics (not stored in activities table)
@@ -55,9 +56,8 @@ class Activity(BaseModel):
 
 
 class ActivityMetrics(BaseModel):
-    """Computed metrics for an activity."""
+    """Computed metrics for an activity (one row per activity, keyed by activity_id)."""
 
-    id: Optional[int] = None
     activity_id: int
 
     tss: Optional[float] = None
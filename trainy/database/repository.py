@@ -1,11 +1,19 @@
 """Data access layer for the database."""
 
 import sqlite3
-from datetime import date, datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
-from .migrations import init_database
+from .migrations import (
+    ROWING_PR_METRICS,
+    init_database,
+    rebuild_pain_rollup,
+    rebuild_rowing_pr_cache,
+)
 from .models import (
     Activity,
     ActivityMetrics,
@@ -18,17 +26,246 @@ from .models import (
 )
 
 
+# Maximum number of activities kept in the per-repository lookup cache
+ACTIVITY_CACHE_SIZE = 256
+
+# Seconds an aggregate query result (stats, TSS series) stays cached
+AGGREGATE_CACHE_TTL_S = 30.0
+
+# Aggregate caches per database file, shared by all Repository instances so
+# they survive the one-repository-per-request lifecycle of the API
+_AGGREGATE_CACHES: dict[str, dict[tuple, tuple[float, Any]]] = {}
+
+
+def _day_bounds(start_date: date, end_date: date) -> tuple[str, str]:
+    """Half-open start_time bounds covering start_date through end_date inclusive.
+
+    Comparing the raw ISO start_time against these keeps range filters
+    index-friendly, unlike wrapping the column in DATE().
+    """
+    return start_date.isoformat(), (end_date + timedelta(days=1)).isoformat()
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+    """Build one dict per result row, keyed by the cursor's column names.
+
+    Zipping the names (read once from cursor.description) with each row is
+    cheaper than dict(row), which looks every key up through sqlite3.Row.
+    """
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+# Explicit column lists, in model field order. Queries select exactly these
+# columns so rows can be unpacked positionally instead of by name.
+ACTIVITY_COLUMNS = (
+    "id",
+    "fit_file_hash",
+    "fit_file_path",
+    "start_time",
+    "end_time",
+    "activity_type",
+    "source",
+    "duration_seconds",
+    "distance_meters",
+    "avg_speed_mps",
+    "max_speed_mps",
+    "total_ascent_m",
+    "total_descent_m",
+    "avg_hr",
+    "max_hr",
+    "avg_power",
+    "max_power",
+    "normalized_power",
+    "avg_cadence",
+    "calories",
+    "title",
+    "imported_at",
+)
+
+DAILY_METRICS_COLUMNS = (
+    "date",
+    "total_tss",
+    "activity_count",
+    "total_duration_s",
+    "total_distance_m",
+    "ctl",
+    "atl",
+    "tsb",
+    "tss_7day",
+    "tss_30day",
+    "tss_90day",
+    "acwr",
+    "monotony",
+    "strain",
+)
+
+PLANNED_WORKOUT_COLUMNS = (
+    "id",
+    "planned_date",
+    "activity_type",
+    "workout_type",
+    "title",
+    "description",
+    "structured_workout",
+    "target_duration_s",
+    "target_distance_m",
+    "target_tss",
+    "target_calories",
+    "target_hr_zone",
+    "target_pace_minkm",
+    "status",
+    "completed_activity_id",
+    "created_at",
+)
+
+ACTIVITY_SELECT = ", ".join(ACTIVITY_COLUMNS)
+ACTIVITY_SELECT_A = ", ".join(f"a.{column}" for column in ACTIVITY_COLUMNS)
+DAILY_METRICS_SELECT = ", ".join(DAILY_METRICS_COLUMNS)
+PLANNED_WORKOUT_SELECT = ", ".join(PLANNED_WORKOUT_COLUMNS)
+
+# Insert columns exclude the generated id and created_at
+PLANNED_WORKOUT_INSERT_COLUMNS = ", ".join(PLANNED_WORKOUT_COLUMNS[1:-1])
+PLANNED_WORKOUT_PLACEHOLDERS = ", ".join("?" * (len(PLANNED_WORKOUT_COLUMNS) - 2))
+
+# Rows per multi-row INSERT, keeps bulk inserts well under SQLite's
+# bound parameter limit (32766 since 3.32)
+BULK_INSERT_CHUNK_SIZE = 500
+
+# Rowing PR targets: (target seconds/meters, label, activity_metrics column)
+ROWING_DISTANCE_TARGETS = (
+    (500, "500m", "rowing_500m_time"),
+    (1000, "1k", "rowing_1k_time"),
+    (2000, "2k", "rowing_2k_time"),
+    (5000, "5k", "rowing_5k_time"),
+    (10000, "10k", "rowing_10k_time"),
+)
+ROWING_TIME_TARGETS = (
+    (60, "1min", "rowing_1min_distance"),
+    (240, "4min", "rowing_4min_distance"),
+    (600, "10min", "rowing_10min_distance"),
+    (1200, "20min", "rowing_20min_distance"),
+    (1800, "30min", "rowing_30min_distance"),
+    (3600, "60min", "rowing_60min_distance"),
+)
+ROWING_POWER_TARGETS = (
+    (60, "1min", "peak_power_1min"),
+    (240, "4min", "peak_power_4min"),
+    (1800, "30min", "peak_power_30min"),
+    (3600, "60min", "peak_power_60min"),
+)
+
+# Relative tolerance when matching whole-activity distances (e.g. 4900-5100m for 5k)
+ROWING_DISTANCE_TOLERANCE = 0.02
+
+# The rowing PR statements have fixed shapes, so their SQL text is built once
+# here and only parameters are bound per call (which also keeps sqlite3's
+# statement cache warm).
+_ROWING_DISTANCE_BUCKET = "CASE" + "".join(
+    f" WHEN distance_meters >= :min_{label} AND distance_meters <= :max_{label} THEN '{label}'"
+    for _, label, _ in ROWING_DISTANCE_TARGETS
+) + " END"
+ROWING_DISTANCE_PRS_SQL = f"""
+    SELECT label, id, duration_seconds, activity_date FROM (
+        SELECT *, ROW_NUMBER() OVER (PARTITION BY label ORDER BY duration_seconds) AS rn
+        FROM (
+            SELECT id, duration_seconds, start_date AS activity_date,
+                   {_ROWING_DISTANCE_BUCKET} AS label
+            FROM activities
+            WHERE activity_type = 'row'
+              AND duration_seconds IS NOT NULL
+        )
+        WHERE label IS NOT NULL
+    )
+    WHERE rn = 1
+"""
+ROWING_DISTANCE_PRS_PARAMS = {
+    f"{bound}_{label}": target_m * (1 + sign * ROWING_DISTANCE_TOLERANCE)
+    for target_m, label, _ in ROWING_DISTANCE_TARGETS
+    for bound, sign in (("min", -1), ("max", 1))
+}
+
+_ROWING_PR_CACHE_SQL = """
+    SELECT metric, value, activity_id, activity_date FROM (
+        SELECT metric, best_value AS value, activity_id, day AS activity_date,
+               ROW_NUMBER() OVER (PARTITION BY metric ORDER BY sort_key) AS rn
+        FROM rowing_pr_cache
+        {date_filter}
+    )
+    WHERE rn = 1
+"""
+ROWING_PR_CACHE_ALL_SQL = _ROWING_PR_CACHE_SQL.format(date_filter="")
+ROWING_PR_CACHE_RANGE_SQL = _ROWING_PR_CACHE_SQL.format(
+    date_filter="WHERE day >= :start AND day <= :end"
+)
+
+
+# (activity_metrics column, lower_is_better) for the rowing power PRs only
+ROWING_POWER_PR_METRICS = tuple((column, False) for _, _, column in ROWING_POWER_TARGETS)
+
+
+@lru_cache(maxsize=None)
+def _best_rowing_metrics_sql(metrics: tuple[tuple[str, bool], ...], ranged: bool) -> str:
+    """Build (once per shape) the UNION ALL top-1 query over activity_metrics columns."""
+    date_filter = "AND a.start_time >= :start AND a.start_time < :end" if ranged else ""
+    return " UNION ALL ".join(
+        f"""
+        SELECT * FROM (
+            SELECT '{column}' AS metric, m.{column} AS value,
+                   a.id AS activity_id, a.start_date AS activity_date
+            FROM activity_metrics m
+            JOIN activities a ON m.activity_id = a.id
+            WHERE a.activity_type = 'row'
+              {date_filter}
+              AND m.{column} IS NOT NULL
+            ORDER BY m.{column} {"ASC" if lower_is_better else "DESC"}
+            LIMIT 1
+        )
+        """
+        for column, lower_is_better in metrics
+    )
+
+
 class Repository:
-    """Data access layer for all database operations."""
+    """Data access layer for all database operations.
+
+    A Repository is meant to be used from a single thread (one instance per
+    request or script run). It keeps small in-memory caches for the current
+    profile, the user settings and activities looked up by ID, which are
+    invalidated by the write methods that could change them. Aggregate
+    queries are cached (with a TTL) per database file and shared across
+    instances; writes through any instance clear them, while writes from
+    another process show up once the TTL expires.
+    """
 
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.conn = init_database(db_path)
+        self._profile_cache: Optional[UserProfile] = None
+        self._settings_cache: Optional[UserSettings] = None
+        self._activity_cache: OrderedDict[int, Activity] = OrderedDict()
+        if str(db_path) == ":memory:":
+            self._agg_cache: dict[tuple, tuple[float, Any]] = {}
+        else:
+            self._agg_cache = _AGGREGATE_CACHES.setdefault(str(Path(db_path).resolve()), {})
 
     def close(self) -> None:
         """Close the database connection."""
         self.conn.close()
 
+    def _cached(self, key: tuple, fn: Callable[[], Any]) -> Any:
+        """Return fn() through the aggregate TTL cache.
+
+        Cached values are shared between calls and must not be mutated.
+        """
+        now = time.monotonic()
+        hit = self._agg_cache.get(key)
+        if hit is not None and now - hit[0] < AGGREGATE_CACHE_TTL_S:
+            return hit[1]
+        value = fn()
+        self._agg_cache[key] = (now, value)
+        return value
+
     # --- Activities ---
 
     def insert_activity(self, activity: Activity) -> int:
@@ -40,8 +277,9 @@ class Repository:
                 activity_type, source, duration_seconds, distance_meters,
                 avg_speed_mps, max_speed_mps, total_ascent_m, total_descent_m,
                 avg_hr, max_hr, avg_power, max_power, normalized_power,
-                avg_cadence, calories, title, raw_fit_data
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                avg_cadence, calories, title
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """,
             (
                 activity.fit_file_hash,
@@ -64,51 +302,78 @@ class Repository:
                 activity.avg_cadence,
                 activity.calories,
                 activity.title,
-                activity.raw_fit_data,
             ),
         )
+        activity_id = cursor.fetchone()[0]
+        if activity.raw_fit_data is not None:
+            self.conn.execute(
+                "INSERT INTO activity_blobs (activity_id, raw_fit_data) VALUES (?, ?)",
+                (activity_id, activity.raw_fit_data),
+            )
         self.conn.commit()
-        return cursor.lastrowid
+        self._agg_cache.clear()
+        self._activity_cache.clear()
+        return activity_id
+
+    def get_raw_fit_data(self, activity_id: int) -> Optional[bytes]:
+        """Get the raw FIT data (gzip-compressed JSON) for an activity."""
+        cursor = self.conn.execute(
+            "SELECT raw_fit_data FROM activity_blobs WHERE activity_id = ?", (activity_id,)
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
 
     def get_activity_by_hash(self, fit_file_hash: str) -> Optional[Activity]:
         """Get activity by FIT file hash."""
         cursor = self.conn.execute(
-            "SELECT * FROM activities WHERE fit_file_hash = ?", (fit_file_hash,)
+            f"SELECT {ACTIVITY_SELECT} FROM activities WHERE fit_file_hash = ?", (fit_file_hash,)
         )
         row = cursor.fetchone()
         return self._row_to_activity(row) if row else None
 
     def get_activity_by_id(self, activity_id: int) -> Optional[Activity]:
-        """Get activity by ID."""
+        """Get activity by ID (cached per repository instance)."""
+        cached = self._activity_cache.get(activity_id)
+        if cached is not None:
+            self._activity_cache.move_to_end(activity_id)
+            return cached.model_copy()
+
         cursor = self.conn.execute(
-            "SELECT * FROM activities WHERE id = ?", (activity_id,)
+            f"SELECT {ACTIVITY_SELECT} FROM activities WHERE id = ?", (activity_id,)
         )
         row = cursor.fetchone()
-        return self._row_to_activity(row) if row else None
+        if not row:
+            return None
+
+        activity = self._row_to_activity(row)
+        self._activity_cache[activity_id] = activity
+        if len(self._activity_cache) > ACTIVITY_CACHE_SIZE:
+            self._activity_cache.popitem(last=False)
+        return activity.model_copy()
 
     def get_activities_by_date_range(
         self, start_date: date, end_date: date
     ) -> list[Activity]:
         """Get activities within a date range."""
         cursor = self.conn.execute(
-            """
-            SELECT * FROM activities
-            WHERE DATE(start_time) >= ? AND DATE(start_time) <= ?
+            f"""
+            SELECT {ACTIVITY_SELECT} FROM activities
+            WHERE start_time >= ? AND start_time < ?
             ORDER BY start_time DESC
             """,
-            (start_date.isoformat(), end_date.isoformat()),
+            _day_bounds(start_date, end_date),
         )
         return [self._row_to_activity(row) for row in cursor.fetchall()]
 
     def get_activities_for_date(self, target_date: date) -> list[Activity]:
         """Get all activities for a specific date."""
         cursor = self.conn.execute(
-            """
-            SELECT * FROM activities
-            WHERE DATE(start_time) = ?
+            f"""
+            SELECT {ACTIVITY_SELECT} FROM activities
+            WHERE start_time >= ? AND start_time < ?
             ORDER BY start_time
             """,
-            (target_date.isoformat(),),
+            _day_bounds(target_date, target_date),
         )
         return [self._row_to_activity(row) for row in cursor.fetchall()]
 
@@ -116,16 +381,18 @@ class Repository:
         self, limit: Optional[int] = None, offset: int = 0
     ) -> list[Activity]:
         """Get all activities with optional pagination."""
-        query = "SELECT * FROM activities ORDER BY start_time DESC"
-        if limit:
-            query += f" LIMIT {limit} OFFSET {offset}"
-        cursor = self.conn.execute(query)
+        # A negative LIMIT is unbounded in SQLite, so the SQL text never changes
+        cursor = self.conn.execute(
+            f"SELECT {ACTIVITY_SELECT} FROM activities ORDER BY start_time DESC LIMIT ? OFFSET ?",
+            (limit if limit else -1, offset),
+        )
         return [self._row_to_activity(row) for row in cursor.fetchall()]
 
     def get_activity_count(self) -> int:
-        """Get total number of activities."""
-        cursor = self.conn.execute("SELECT COUNT(*) FROM activities")
-        return cursor.fetchone()[0]
+        """Get total number of activities (from the trigger-maintained counter)."""
+        cursor = self.conn.execute("SELECT n FROM activity_counter WHERE id = 1")
+        row = cursor.fetchone()
+        return row[0] if row else 0
 
     def get_recent_activities(self, days: int = 30) -> list[Activity]:
         """Get activities from the last N days."""
@@ -136,56 +403,32 @@ class Repository:
         """Get activities from the last N days with TSS joined from activity_metrics."""
         start_date = date.today() - timedelta(days=days)
         cursor = self.conn.execute(
-            """
-            SELECT a.*, m.tss
+            f"""
+            SELECT {ACTIVITY_SELECT_A}, m.tss
             FROM activities a
             LEFT JOIN activity_metrics m ON a.id = m.activity_id
-            WHERE DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
+            WHERE a.start_time >= ? AND a.start_time < ?
             ORDER BY a.start_time DESC
             """,
-            (start_date.isoformat(), date.today().isoformat()),
+            _day_bounds(start_date, date.today()),
         )
         return [self._row_to_activity_with_tss(row) for row in cursor.fetchall()]
 
     def _row_to_activity_with_tss(self, row: sqlite3.Row) -> Activity:
         """Convert database row to Activity model including TSS from join."""
         activity = self._row_to_activity(row)
-        activity.tss = row["tss"] if "tss" in row.keys() else None
+        activity.tss = row[len(ACTIVITY_COLUMNS)]
         return activity
 
     def _row_to_activity(self, row: sqlite3.Row) -> Activity:
-        """Convert database row to Activity model."""
-        return Activity(
-            id=row["id"],
-            fit_file_hash=row["fit_file_hash"],
-            fit_file_path=row["fit_file_path"],
-            start_time=datetime.fromisoformat(row["start_time"]),
-            end_time=datetime.fromisoformat(row["end_time"]) if row["end_time"] else None,
-            activity_type=row["activity_type"],
-            source=row["source"],
-            duration_seconds=row["duration_seconds"],
-            distance_meters=row["distance_meters"],
-            avg_speed_mps=row["avg_speed_mps"],
-            max_speed_mps=row["max_speed_mps"],
-            total_ascent_m=row["total_ascent_m"],
-            total_descent_m=row["total_descent_m"],
-            avg_hr=row["avg_hr"],
-            max_hr=row["max_hr"],
-            avg_power=row["avg_power"],
-            max_power=row["max_power"],
-            normalized_power=row["normalized_power"],
-            avg_cadence=row["avg_cadence"],
-            calories=row["calories"],
-            title=row["title"],
-            imported_at=datetime.fromisoformat(row["imported_at"]) if row["imported_at"] else None,
-            raw_fit_data=row["raw_fit_data"],
-        )
+        """Convert a row selected with ACTIVITY_COLUMNS to Activity model."""
+        return Activity(**dict(zip(ACTIVITY_COLUMNS, row)))
 
     # --- Activity Metrics ---
 
     def insert_activity_metrics(self, metrics: ActivityMetrics) -> int:
-        """Insert or update activity metrics."""
-        cursor = self.conn.execute(
+        """Insert or update activity metrics, returns the activity ID keying the row."""
+        self.conn.execute(
             """
             INSERT OR REPLACE INTO activity_metrics (
                 activity_id, tss, tss_method, intensity_factor,
@@ -224,8 +467,10 @@ class Repository:
                 metrics.rowing_60min_distance,
             ),
         )
+        self._refresh_rowing_pr_cache(metrics.activity_id)
         self.conn.commit()
-        return cursor.lastrowid
+        self._agg_cache.clear()
+        return metrics.activity_id
 
     def get_activity_metrics(self, activity_id: int) -> Optional[ActivityMetrics]:
         """Get metrics for an activity."""
@@ -236,7 +481,6 @@ class Repository:
         if row:
             keys = row.keys()
             return ActivityMetrics(
-                id=row["id"],
                 activity_id=row["activity_id"],
                 tss=row["tss"],
                 tss_method=row["tss_method"],
@@ -261,7 +505,7 @@ class Repository:
                 rowing_20min_distance=row["rowing_20min_distance"] if "rowing_20min_distance" in keys else None,
                 rowing_30min_distance=row["rowing_30min_distance"] if "rowing_30min_distance" in keys else None,
                 rowing_60min_distance=row["rowing_60min_distance"] if "rowing_60min_distance" in keys else None,
-                calculated_at=datetime.fromisoformat(row["calculated_at"]) if row["calculated_at"] else None,
+                calculated_at=row["calculated_at"],
             )
         return None
 
@@ -274,7 +518,18 @@ class Repository:
             """,
             (activity_id, tss, tss_method, intensity_factor),
         )
+        self._refresh_rowing_pr_cache(activity_id)
         self.conn.commit()
+        self._agg_cache.clear()
+
+    def _refresh_rowing_pr_cache(self, activity_id: int) -> None:
+        """Recompute the rowing PR cache for the day of a rowing activity (no commit)."""
+        row = self.conn.execute(
+            "SELECT start_date, activity_type FROM activities WHERE id = ?",
+            (activity_id,),
+        ).fetchone()
+        if row and row[1] == "row":
+            rebuild_rowing_pr_cache(self.conn, date.fromisoformat(row[0]))
 
     # --- Daily Metrics ---
 
@@ -306,11 +561,12 @@ class Repository:
             ),
         )
         self.conn.commit()
+        self._agg_cache.clear()
 
     def get_daily_metrics(self, target_date: date) -> Optional[DailyMetrics]:
         """Get daily metrics for a specific date."""
         cursor = self.conn.execute(
-            "SELECT * FROM daily_metrics WHERE date = ?", (target_date.isoformat(),)
+            f"SELECT {DAILY_METRICS_SELECT} FROM daily_metrics WHERE date = ?", (target_date.isoformat(),)
         )
         row = cursor.fetchone()
         if row:
@@ -318,30 +574,19 @@ class Repository:
         return None
 
     def _row_to_daily_metrics(self, row: sqlite3.Row) -> DailyMetrics:
-        """Convert database row to DailyMetrics model."""
-        keys = row.keys()
-        return DailyMetrics(
-            date=date.fromisoformat(row["date"]),
-            total_tss=row["total_tss"] or 0,
-            activity_count=row["activity_count"] or 0,
-            total_duration_s=row["total_duration_s"] or 0,
-            total_distance_m=row["total_distance_m"] or 0,
-            ctl=row["ctl"],
-            atl=row["atl"],
-            tsb=row["tsb"],
-            tss_7day=row["tss_7day"],
-            tss_30day=row["tss_30day"],
-            tss_90day=row["tss_90day"],
-            acwr=row["acwr"] if "acwr" in keys else None,
-            monotony=row["monotony"] if "monotony" in keys else None,
-            strain=row["strain"] if "strain" in keys else None,
-        )
+        """Convert a row selected with DAILY_METRICS_COLUMNS to DailyMetrics model."""
+        values = dict(zip(DAILY_METRICS_COLUMNS, row))
+        values["total_tss"] = values["total_tss"] or 0
+        values["activity_count"] = values["activity_count"] or 0
+        values["total_duration_s"] = values["total_duration_s"] or 0
+        values["total_distance_m"] = values["total_distance_m"] or 0
+        return DailyMetrics(**values)
 
     def get_daily_metrics_range(self, start_date: date, end_date: date) -> list[DailyMetrics]:
         """Get daily metrics for a date range."""
         cursor = self.conn.execute(
-            """
-            SELECT * FROM daily_metrics
+            f"""
+            SELECT {DAILY_METRICS_SELECT} FROM daily_metrics
             WHERE date >= ? AND date <= ?
             ORDER BY date
             """,
@@ -352,7 +597,7 @@ class Repository:
     def get_latest_daily_metrics(self) -> Optional[DailyMetrics]:
         """Get the most recent daily metrics."""
         cursor = self.conn.execute(
-            "SELECT * FROM daily_metrics ORDER BY date DESC LIMIT 1"
+            f"SELECT {DAILY_METRICS_SELECT} FROM daily_metrics ORDER BY date DESC LIMIT 1"
         )
         row = cursor.fetchone()
         if row:
@@ -362,7 +607,10 @@ class Repository:
     # --- User Profile ---
 
     def get_current_profile(self) -> UserProfile:
-        """Get the current user profile."""
+        """Get the current user profile (cached until a profile write)."""
+        if self._profile_cache is not None:
+            return self._profile_cache.model_copy()
+
         cursor = self.conn.execute(
             """
             SELECT * FROM user_profile
@@ -373,7 +621,7 @@ class Repository:
         )
         row = cursor.fetchone()
         if row:
-            return UserProfile(
+            self._profile_cache = UserProfile(
                 id=row["id"],
                 ftp=row["ftp"],
                 lthr=row["lthr"],
@@ -382,9 +630,10 @@ class Repository:
                 threshold_pace_minkm=row["threshold_pace_minkm"],
                 swim_threshold_pace=row["swim_threshold_pace"],
                 weight_kg=row["weight_kg"],
-                effective_from=date.fromisoformat(row["effective_from"]),
+                effective_from=row["effective_from"],
                 metrics_dirty=bool(row["metrics_dirty"]),
             )
+            return self._profile_cache.model_copy()
         # Return default profile if none exists
         return UserProfile()
 
@@ -396,6 +645,7 @@ class Repository:
                 ftp, lthr, max_hr, resting_hr, threshold_pace_minkm,
                 swim_threshold_pace, weight_kg, effective_from, metrics_dirty
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """,
             (
                 profile.ftp,
@@ -409,8 +659,10 @@ class Repository:
                 profile.metrics_dirty,
             ),
         )
+        profile_id = cursor.fetchone()[0]
         self.conn.commit()
-        return cursor.lastrowid
+        self._profile_cache = None
+        return profile_id
 
     def update_profile(self, profile: UserProfile) -> None:
         """Update existing profile."""
@@ -435,6 +687,7 @@ class Repository:
             ),
         )
         self.conn.commit()
+        self._profile_cache = None
 
     def set_metrics_dirty(self, dirty: bool) -> None:
         """Set the metrics_dirty flag on the current profile."""
@@ -446,57 +699,84 @@ class Repository:
             (dirty,),
         )
         self.conn.commit()
+        self._profile_cache = None
 
     # --- Planned Workouts ---
 
     def insert_planned_workout(self, workout: PlannedWorkout) -> int:
         """Insert a planned workout."""
         cursor = self.conn.execute(
-            """
-            INSERT INTO planned_workouts (
-                planned_date, activity_type, workout_type,
-                title, description, structured_workout, target_duration_s,
-                target_distance_m, target_tss, target_calories, target_hr_zone, target_pace_minkm,
-                status, completed_activity_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            f"""
+            INSERT INTO planned_workouts ({PLANNED_WORKOUT_INSERT_COLUMNS})
+            VALUES ({PLANNED_WORKOUT_PLACEHOLDERS})
+            RETURNING id
             """,
-            (
-                workout.planned_date.isoformat(),
-                workout.activity_type,
-                workout.workout_type,
-                workout.title,
-                workout.description,
-                workout.structured_workout,
-                workout.target_duration_s,
-                workout.target_distance_m,
-                workout.target_tss,
-                workout.target_calories,
-                workout.target_hr_zone,
-                workout.target_pace_minkm,
-                workout.status,
-                workout.completed_activity_id,
-            ),
+            self._planned_workout_params(workout),
         )
+        workout_id = cursor.fetchone()[0]
         self.conn.commit()
-        return cursor.lastrowid
+        self._agg_cache.clear()
+        return workout_id
 
     def bulk_insert_planned_workouts(self, workouts: list[PlannedWorkout]) -> list[int]:
-        """Insert multiple planned workouts in a batch."""
-        return [self.insert_planned_workout(workout) for workout in workouts]
+        """Insert multiple planned workouts in a batch.
+
+        Uses multi-row INSERT ... RETURNING statements, chunked to stay under
+        SQLite's bound parameter limit. Returns IDs in input order.
+        """
+        ids: list[int] = []
+        for start in range(0, len(workouts), BULK_INSERT_CHUNK_SIZE):
+            chunk = workouts[start:start + BULK_INSERT_CHUNK_SIZE]
+            values = ", ".join([f"({PLANNED_WORKOUT_PLACEHOLDERS})"] * len(chunk))
+            params = [param for workout in chunk for param in self._planned_workout_params(workout)]
+            cursor = self.conn.execute(
+                f"""
+                INSERT INTO planned_workouts ({PLANNED_WORKOUT_INSERT_COLUMNS})
+                VALUES {values}
+                RETURNING id
+                """,
+                params,
+            )
+            # RETURNING row order is unspecified, but rowids within one
+            # statement are assigned in ascending insertion order
+            ids.extend(sorted(row[0] for row in cursor.fetchall()))
+        self.conn.commit()
+        self._agg_cache.clear()
+        return ids
+
+    def _planned_workout_params(self, workout: PlannedWorkout) -> tuple:
+        """Build insert parameters for a planned workout (PLANNED_WORKOUT_INSERT_COLUMNS order)."""
+        return (
+            workout.planned_date.isoformat(),
+            workout.activity_type,
+            workout.workout_type,
+            workout.title,
+            workout.description,
+            workout.structured_workout,
+            workout.target_duration_s,
+            workout.target_distance_m,
+            workout.target_tss,
+            workout.target_calories,
+            workout.target_hr_zone,
+            workout.target_pace_minkm,
+            workout.status,
+            workout.completed_activity_id,
+        )
 
     def delete_planned_workout(self, workout_id: int) -> bool:
         """Delete a planned workout."""
-        cursor = self.conn.execute(
-            "DELETE FROM planned_workouts WHERE id = ?",
-            (workout_id,),
-        )
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM planned_workouts WHERE id = ?",
+                (workout_id,),
+            )
+        self._agg_cache.clear()
         return cursor.rowcount > 0
 
     def get_planned_workout_by_id(self, workout_id: int) -> Optional[PlannedWorkout]:
         """Get a planned workout by ID."""
         cursor = self.conn.execute(
-            "SELECT * FROM planned_workouts WHERE id = ?",
+            f"SELECT {PLANNED_WORKOUT_SELECT} FROM planned_workouts WHERE id = ?",
             (workout_id,),
         )
         row = cursor.fetchone()
@@ -505,8 +785,8 @@ class Repository:
     def get_planned_workouts_for_date(self, target_date: date) -> list[PlannedWorkout]:
         """Get planned workouts for a specific date."""
         cursor = self.conn.execute(
-            """
-            SELECT * FROM planned_workouts
+            f"""
+            SELECT {PLANNED_WORKOUT_SELECT} FROM planned_workouts
             WHERE planned_date = ?
             ORDER BY id
             """,
@@ -519,8 +799,8 @@ class Repository:
     ) -> list[PlannedWorkout]:
         """Get planned workouts in a date range."""
         cursor = self.conn.execute(
-            """
-            SELECT * FROM planned_workouts
+            f"""
+            SELECT {PLANNED_WORKOUT_SELECT} FROM planned_workouts
             WHERE planned_date >= ? AND planned_date <= ?
             ORDER BY planned_date
             """,
@@ -595,34 +875,16 @@ class Repository:
         return self.get_planned_workout_by_id(workout_id)
 
     def _row_to_planned_workout(self, row: sqlite3.Row) -> PlannedWorkout:
-        """Convert row to PlannedWorkout."""
-        keys = row.keys()
-        return PlannedWorkout(
-            id=row["id"],
-            planned_date=date.fromisoformat(row["planned_date"]),
-            activity_type=row["activity_type"],
-            workout_type=row["workout_type"],
-            title=row["title"],
-            description=row["description"],
-            structured_workout=row["structured_workout"],
-            target_duration_s=row["target_duration_s"],
-            target_distance_m=row["target_distance_m"],
-            target_tss=row["target_tss"],
-            target_calories=row["target_calories"] if "target_calories" in keys else None,
-            target_hr_zone=row["target_hr_zone"],
-            target_pace_minkm=row["target_pace_minkm"],
-            status=row["status"],
-            completed_activity_id=row["completed_activity_id"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-        )
+        """Convert a row selected with PLANNED_WORKOUT_COLUMNS to PlannedWorkout."""
+        return PlannedWorkout(**dict(zip(PLANNED_WORKOUT_COLUMNS, row)))
 
     def get_upcoming_planned_workouts(self, days: int = 7) -> list[PlannedWorkout]:
         """Get planned workouts for the next N days."""
         start = date.today()
         end = start + timedelta(days=days)
         cursor = self.conn.execute(
-            """
-            SELECT * FROM planned_workouts
+            f"""
+            SELECT {PLANNED_WORKOUT_SELECT} FROM planned_workouts
             WHERE planned_date >= ? AND planned_date <= ?
             AND status = 'planned'
             ORDER BY planned_date
@@ -634,8 +896,8 @@ class Repository:
     def get_unmatched_planned_workouts_for_date(self, target_date: date) -> list[PlannedWorkout]:
         """Get planned workouts for a date that haven't been matched to an activity."""
         cursor = self.conn.execute(
-            """
-            SELECT * FROM planned_workouts
+            f"""
+            SELECT {PLANNED_WORKOUT_SELECT} FROM planned_workouts
             WHERE planned_date = ? AND completed_activity_id IS NULL AND status = 'planned'
             ORDER BY id
             """,
@@ -667,6 +929,7 @@ class Repository:
                 muscle_soreness, fatigue_level, has_pain, pain_location,
                 pain_severity, notes
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """,
             (
                 feedback.activity_id,
@@ -685,8 +948,11 @@ class Repository:
                 feedback.notes,
             ),
         )
+        feedback_id = cursor.fetchone()[0]
+        self._refresh_pain_rollup(feedback_id)
         self.conn.commit()
-        return cursor.lastrowid
+        self._agg_cache.clear()
+        return feedback_id
 
     def get_feedback_for_activity(self, activity_id: int) -> Optional[WorkoutFeedback]:
         """Get feedback for an activity."""
@@ -711,7 +977,7 @@ class Repository:
                 pain_location=row["pain_location"],
                 pain_severity=row["pain_severity"],
                 notes=row["notes"],
-                created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
+                created_at=row["created_at"],
             )
         return None
 
@@ -742,8 +1008,23 @@ class Repository:
                 feedback.id,
             ),
         )
+        self._refresh_pain_rollup(feedback.id)
         self.conn.commit()
 
+    def _refresh_pain_rollup(self, feedback_id: int) -> None:
+        """Recompute the pain rollup for the activity day of a feedback entry (no commit)."""
+        row = self.conn.execute(
+            """
+            SELECT a.start_date
+            FROM workout_feedback wf
+            JOIN activities a ON wf.activity_id = a.id
+            WHERE wf.id = ?
+            """,
+            (feedback_id,),
+        ).fetchone()
+        if row:
+            rebuild_pain_rollup(self.conn, date.fromisoformat(row[0]))
+
     # --- Utility Methods ---
 
     def get_weekly_tss_totals(self, weeks: int = 12) -> list[dict]:
@@ -751,6 +1032,35 @@ class Repository:
 
         Returns list of dicts with 'week_start' and 'total_tss' keys.
         """
+        return self._cached(("weekly_tss_totals", weeks), lambda: self._query_weekly_tss_totals(weeks))
+
+    def _query_weekly_tss_totals(self, weeks: int) -> list[dict]:
+        """Run the weekly TSS totals query (uncached).
+
+        Rolls up the per-day totals already stored in daily_metrics. Falls back
+        to aggregating activities directly when daily metrics have not been
+        calculated for the window yet.
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT
+                DATE(date, 'weekday 0', '-6 days') as week_start,
+                COALESCE(SUM(total_tss), 0) as total_tss
+            FROM daily_metrics
+            WHERE date >= DATE('now', ? || ' days')
+            GROUP BY week_start
+            ORDER BY week_start
+            """,
+            (f"-{weeks * 7}",),
+        )
+        totals = [
+            {"week_start": row[0], "total_tss": round(row[1] or 0)}
+            for row in cursor
+        ]
+        return totals or self._query_weekly_tss_totals_from_activities(weeks)
+
+    def _query_weekly_tss_totals_from_activities(self, weeks: int) -> list[dict]:
+        """Aggregate weekly TSS totals from activities and their metrics."""
         cursor = self.conn.execute(
             """
             SELECT
@@ -758,7 +1068,7 @@ class Repository:
                 COALESCE(SUM(m.tss), 0) as total_tss
             FROM activities a
             LEFT JOIN activity_metrics m ON a.id = m.activity_id
-            WHERE DATE(start_time) >= DATE('now', ? || ' days')
+            WHERE a.start_time >= DATE('now', ? || ' days')
             GROUP BY week_start
             ORDER BY week_start
             """,
@@ -771,31 +1081,45 @@ class Repository:
 
     def get_daily_tss_series(self) -> list[tuple[date, float]]:
         """Get (date, total_tss) for all days with activities."""
+        return self._cached(("daily_tss_series",), self._query_daily_tss_series)
+
+    def _query_daily_tss_series(self) -> list[tuple[date, float]]:
+        """Run the daily TSS series query (uncached)."""
+        return list(self.iter_daily_tss_series())
+
+    def iter_daily_tss_series(self, batch_size: int = 1024) -> Iterator[tuple[date, float]]:
+        """Yield (date, total_tss) for all days with activities, fetched in batches.
+
+        The underlying cursor stays open until the generator is exhausted, so
+        consume it fully before issuing writes on this repository.
+        """
         cursor = self.conn.execute(
             """
-            SELECT DATE(a.start_time) as day, COALESCE(SUM(m.tss), 0) as daily_tss
+            SELECT a.start_date as day, COALESCE(SUM(m.tss), 0) as daily_tss
             FROM activities a
             LEFT JOIN activity_metrics m ON a.id = m.activity_id
-            GROUP BY DATE(a.start_time)
+            GROUP BY a.start_date
             ORDER BY day
             """
         )
-        return [(date.fromisoformat(row[0]), row[1] or 0) for row in cursor.fetchall()]
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                yield date.fromisoformat(row[0]), row[1] or 0
 
     def get_daily_tss_from_date(self, start_date: date) -> list[tuple[date, float]]:
         """Get (date, total_tss) from start_date onwards."""
         cursor = self.conn.execute(
             """
-            SELECT DATE(a.start_time) as day, COALESCE(SUM(m.tss), 0) as daily_tss
+            SELECT a.start_date as day, COALESCE(SUM(m.tss), 0) as daily_tss
             FROM activities a
             LEFT JOIN activity_metrics m ON a.id = m.activity_id
-            WHERE DATE(a.start_time) >= ?
-            GROUP BY DATE(a.start_time)
+            WHERE a.start_time >= ?
+            GROUP BY a.start_date
             ORDER BY day
             """,
             (start_date.isoformat(),),
         )
-        return [(date.fromisoformat(row[0]), row[1] or 0) for row in cursor.fetchall()]
+        return [(date.fromisoformat(row[0]), row[1] or 0) for row in cursor]
 
     def get_activities_by_ids(self, activity_ids: list[int]) -> list[Activity]:
         """Get multiple activities by their IDs."""
@@ -803,235 +1127,245 @@ class Repository:
             return []
         placeholders = ",".join("?" * len(activity_ids))
         cursor = self.conn.execute(
-            f"SELECT * FROM activities WHERE id IN ({placeholders}) ORDER BY start_time",
+            f"SELECT {ACTIVITY_SELECT} FROM activities WHERE id IN ({placeholders}) ORDER BY start_time",
             activity_ids,
         )
         return [self._row_to_activity(row) for row in cursor.fetchall()]
 
     def rebuild_daily_metrics(self) -> None:
         """Rebuild all daily metrics from activities."""
-        # Get all days with activities
+        # Get all days with activities and their TSS in one pass
+        # (activity_metrics is keyed by activity_id, so the join cannot fan out)
         cursor = self.conn.execute(
             """
-            SELECT DATE(start_time) as day,
+            SELECT a.start_date as day,
                    COUNT(*) as count,
-                   SUM(duration_seconds) as duration,
-                   SUM(distance_meters) as distance
-            FROM activities
-            GROUP BY DATE(start_time)
+                   SUM(a.duration_seconds) as duration,
+                   SUM(a.distance_meters) as distance,
+                   SUM(m.tss) as tss
+            FROM activities a
+            LEFT JOIN activity_metrics m ON a.id = m.activity_id
+            GROUP BY a.start_date
             ORDER BY day
             """
         )
 
         daily_data = {}
-        for row in cursor.fetchall():
+        for row in cursor:
             day = date.fromisoformat(row[0])
             daily_data[day] = {
                 "count": row[1],
                 "duration": row[2] or 0,
                 "distance": row[3] or 0,
+                "tss": row[4] or 0,
             }
 
-        # Get TSS per day
-        cursor = self.conn.execute(
-            """
-            SELECT DATE(a.start_time) as day, SUM(m.tss) as tss
-            FROM activities a
-            JOIN activity_metrics m ON a.id = m.activity_id
-            GROUP BY DATE(a.start_time)
-            """
-        )
-        for row in cursor.fetchall():
-            day = date.fromisoformat(row[0])
-            if day in daily_data:
-                daily_data[day]["tss"] = row[1] or 0
-
-        # Update daily_metrics table
-        for day, data in daily_data.items():
-            metrics = DailyMetrics(
-                date=day,
-                total_tss=data.get("tss", 0),
-                activity_count=data["count"],
-                total_duration_s=data["duration"],
-                total_distance_m=data["distance"],
+        # Upsert all days in one transaction. Derived load columns are reset to
+        # NULL (as a full-row replace would) until the metrics recalculation.
+        rows = [
+            (day.isoformat(), data.get("tss", 0), data["count"], data["duration"], data["distance"])
+            for day, data in daily_data.items()
+        ]
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO daily_metrics (
+                    date, total_tss, activity_count, total_duration_s, total_distance_m
+                ) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(date) DO UPDATE SET
+                    total_tss = excluded.total_tss,
+                    activity_count = excluded.activity_count,
+                    total_duration_s = excluded.total_duration_s,
+                    total_distance_m = excluded.total_distance_m,
+                    ctl = NULL, atl = NULL, tsb = NULL,
+                    tss_7day = NULL, tss_30day = NULL, tss_90day = NULL,
+                    acwr = NULL, monotony = NULL, strain = NULL
+                """,
+                rows,
             )
-            self.upsert_daily_metrics(metrics)
+        self._agg_cache.clear()
 
     def delete_all_activities(self) -> int:
         """Delete all activities and their metrics. Returns count deleted."""
-        # First delete activity metrics
-        self.conn.execute("DELETE FROM activity_metrics")
-        # Then delete activities
-        cursor = self.conn.execute("DELETE FROM activities")
-        self.conn.commit()
+        with self.conn:
+            # First delete activity metrics and raw FIT data
+            self.conn.execute("DELETE FROM activity_metrics")
+            self.conn.execute("DELETE FROM activity_blobs")
+            self.conn.execute("DELETE FROM rowing_pr_cache")
+            self.conn.execute("DELETE FROM pain_rollup")
+            # Then delete activities
+            cursor = self.conn.execute("DELETE FROM activities")
+        self._agg_cache.clear()
+        self._activity_cache.clear()
         return cursor.rowcount
 
     def delete_all_daily_metrics(self) -> int:
         """Delete all daily metrics. Returns count deleted."""
-        cursor = self.conn.execute("DELETE FROM daily_metrics")
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM daily_metrics")
+        self._agg_cache.clear()
         return cursor.rowcount
 
     def get_data_stats(self) -> dict:
         """Get counts of all data types for deletion confirmation UI."""
-        activities = self.conn.execute("SELECT COUNT(*) FROM activities").fetchone()[0]
-        planned_workouts = self.conn.execute("SELECT COUNT(*) FROM planned_workouts").fetchone()[0]
-        activity_metrics = self.conn.execute("SELECT COUNT(*) FROM activity_metrics").fetchone()[0]
-        daily_metrics = self.conn.execute("SELECT COUNT(*) FROM daily_metrics").fetchone()[0]
-        workout_feedback = self.conn.execute("SELECT COUNT(*) FROM workout_feedback").fetchone()[0]
+        return self._cached(("data_stats",), self._query_data_stats)
+
+    def _query_data_stats(self) -> dict:
+        """Count rows of all data types (uncached)."""
+        row = self.conn.execute(
+            """
+            SELECT
+                (SELECT n FROM activity_counter WHERE id = 1),
+                (SELECT COUNT(*) FROM planned_workouts),
+                (SELECT COUNT(*) FROM activity_metrics),
+                (SELECT COUNT(*) FROM daily_metrics),
+                (SELECT COUNT(*) FROM workout_feedback)
+            """
+        ).fetchone()
         return {
-            "activities": activities,
-            "planned_workouts": planned_workouts,
-            "activity_metrics": activity_metrics,
-            "daily_metrics": daily_metrics,
-            "workout_feedback": workout_feedback,
+            "activities": row[0] or 0,
+            "planned_workouts": row[1],
+            "activity_metrics": row[2],
+            "daily_metrics": row[3],
+            "workout_feedback": row[4],
         }
 
     def delete_all_planned_workouts(self) -> int:
         """Delete all planned workouts and orphaned feedback. Returns count deleted."""
-        # Delete orphaned workout feedback (where activity_id IS NULL)
-        self.conn.execute("DELETE FROM workout_feedback WHERE activity_id IS NULL")
-        # Delete all planned workouts
-        cursor = self.conn.execute("DELETE FROM planned_workouts")
-        self.conn.commit()
+        with self.conn:
+            # Delete orphaned workout feedback (where activity_id IS NULL)
+            self.conn.execute("DELETE FROM workout_feedback WHERE activity_id IS NULL")
+            # Delete all planned workouts
+            cursor = self.conn.execute("DELETE FROM planned_workouts")
+        self._agg_cache.clear()
         return cursor.rowcount
 
     def delete_all_user_data(self) -> dict:
         """Delete all user data except profile. Returns counts deleted."""
-        # Delete in order respecting foreign keys
-        feedback_count = self.conn.execute("DELETE FROM workout_feedback").rowcount
-        activity_metrics_count = self.conn.execute("DELETE FROM activity_metrics").rowcount
-        daily_metrics_count = self.conn.execute("DELETE FROM daily_metrics").rowcount
-        planned_workouts_count = self.conn.execute("DELETE FROM planned_workouts").rowcount
-        activities_count = self.conn.execute("DELETE FROM activities").rowcount
-        self.conn.commit()
-        return {
-            "activities": activities_count,
-            "planned_workouts": planned_workouts_count,
-            "activity_metrics": activity_metrics_count,
-            "daily_metrics": daily_metrics_count,
-            "workout_feedback": feedback_count,
-        }
+        # Delete in order respecting foreign keys, as one transaction
+        with self.conn:
+            counts = self._query_data_stats()
+            self.conn.execute("DELETE FROM workout_feedback")
+            self.conn.execute("DELETE FROM activity_metrics")
+            self.conn.execute("DELETE FROM daily_metrics")
+            self.conn.execute("DELETE FROM planned_workouts")
+            self.conn.execute("DELETE FROM activity_blobs")
+            self.conn.execute("DELETE FROM rowing_pr_cache")
+            self.conn.execute("DELETE FROM pain_rollup")
+            self.conn.execute("DELETE FROM activities")
+        self._agg_cache.clear()
+        self._activity_cache.clear()
+        return counts
 
     def get_peak_powers_for_range(self, start_date: date, end_date: date) -> list[dict]:
         """Get best peak powers for each duration within a date range."""
         cursor = self.conn.execute(
             """
             SELECT m.peak_power_5s, m.peak_power_1min, m.peak_power_5min, m.peak_power_20min,
-                   a.id as activity_id, DATE(a.start_time) as activity_date
+                   a.id as activity_id, a.start_date as activity_date
             FROM activity_metrics m
             JOIN activities a ON m.activity_id = a.id
-            WHERE DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
+            WHERE a.start_time >= ? AND a.start_time < ?
               AND a.activity_type = 'cycle'
               AND (m.peak_power_5s IS NOT NULL OR m.peak_power_1min IS NOT NULL
                    OR m.peak_power_5min IS NOT NULL OR m.peak_power_20min IS NOT NULL)
             """,
-            (start_date.isoformat(), end_date.isoformat()),
+            _day_bounds(start_date, end_date),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
     def get_rowing_activities_with_fit_paths(self) -> list[dict]:
         """Get all rowing activities that have FIT file paths."""
         cursor = self.conn.execute(
             """
-            SELECT id, fit_file_path, DATE(start_time) as start_date
+            SELECT id, fit_file_path, start_date
             FROM activities
             WHERE activity_type = 'row'
               AND fit_file_path IS NOT NULL
             ORDER BY start_time DESC
             """
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
     def get_rowing_distance_prs(self) -> list[dict]:
         """Get best rowing times for standard distances (500m, 1k, 2k, 5k, 10k).
 
-        Uses a 2% tolerance to match distances (e.g., 4950-5050m for 5k).
+        Uses a 2% tolerance to match distances (e.g., 4900-5100m for 5k).
+        Each rowing activity is bucketed by distance and the fastest per bucket
+        is picked with ROW_NUMBER(), in a single pass over activities.
         """
-        distances = [
-            (500, "500m", 0.02),
-            (1000, "1k", 0.02),
-            (2000, "2k", 0.02),
-            (5000, "5k", 0.02),
-            (10000, "10k", 0.02),
-        ]
+        cursor = self.conn.execute(ROWING_DISTANCE_PRS_SQL, ROWING_DISTANCE_PRS_PARAMS)
+        best = {row["label"]: row for row in cursor}
 
         results = []
-        for target_m, label, tolerance in distances:
-            min_dist = target_m * (1 - tolerance)
-            max_dist = target_m * (1 + tolerance)
+        for target_m, label, _ in ROWING_DISTANCE_TARGETS:
+            row = best.get(label)
+            results.append({
+                "distance_meters": target_m,
+                "distance_label": label,
+                "total_seconds": row["duration_seconds"] if row else None,
+                "activity_id": row["id"] if row else None,
+                "activity_date": row["activity_date"] if row else None,
+            })
+
+        return results
 
+    def _get_best_rowing_metrics(
+        self,
+        metrics: tuple[tuple[str, bool], ...] = ROWING_PR_METRICS,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> dict[str, sqlite3.Row]:
+        """Get the best value of each (column, lower_is_better) metric over rowing activities.
+
+        Issues one UNION ALL query with a top-1 branch per column. Returns a
+        dict keyed by column name with rows of (metric, value, activity_id,
+        activity_date); columns without any value are missing from the dict.
+        """
+        ranged = start_date is not None and end_date is not None
+        params: dict[str, str] = {}
+        if ranged:
+            params = dict(zip(("start", "end"), _day_bounds(start_date, end_date)))
+
+        sql = _best_rowing_metrics_sql(metrics, ranged)
+        cursor = self.conn.execute(sql, params)
+        return {row["metric"]: row for row in cursor}
+
+    def _get_cached_rowing_prs(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> dict[str, sqlite3.Row]:
+        """Get the best value of every rowing PR metric from rowing_pr_cache.
+
+        Returns rows shaped like _get_best_rowing_metrics, keyed by metric.
+        """
+        if start_date is not None and end_date is not None:
             cursor = self.conn.execute(
-                """
-                SELECT id, distance_meters, duration_seconds, DATE(start_time) as activity_date
-                FROM activities
-                WHERE activity_type = 'row'
-                  AND distance_meters >= ? AND distance_meters <= ?
-                  AND duration_seconds IS NOT NULL
-                ORDER BY duration_seconds ASC
-                LIMIT 1
-                """,
-                (min_dist, max_dist),
+                ROWING_PR_CACHE_RANGE_SQL,
+                {"start": start_date.isoformat(), "end": end_date.isoformat()},
             )
-            row = cursor.fetchone()
-            if row:
-                results.append({
-                    "distance_meters": target_m,
-                    "distance_label": label,
-                    "total_seconds": row["duration_seconds"],
-                    "activity_id": row["id"],
-                    "activity_date": row["activity_date"],
-                })
-            else:
-                results.append({
-                    "distance_meters": target_m,
-                    "distance_label": label,
-                    "total_seconds": None,
-                    "activity_id": None,
-                    "activity_date": None,
-                })
-
-        return results
+        else:
+            cursor = self.conn.execute(ROWING_PR_CACHE_ALL_SQL)
+        return {row["metric"]: row for row in cursor}
 
     def get_rowing_power_prs(self) -> list[dict]:
         """Get best rowing power at standard durations (1min, 4min, 30min, 60min)."""
-        durations = [
-            (60, "1min", "peak_power_1min"),
-            (240, "4min", "peak_power_4min"),
-            (1800, "30min", "peak_power_30min"),
-            (3600, "60min", "peak_power_60min"),
-        ]
+        best = self._get_cached_rowing_prs()
+        if not best:
+            # Cache empty (e.g. rows written outside the repository): query directly
+            best = self._get_best_rowing_metrics(ROWING_POWER_PR_METRICS)
 
         results = []
-        for duration_s, label, column in durations:
-            cursor = self.conn.execute(
-                f"""
-                SELECT m.{column} as power, a.id as activity_id, DATE(a.start_time) as activity_date
-                FROM activity_metrics m
-                JOIN activities a ON m.activity_id = a.id
-                WHERE a.activity_type = 'row'
-                  AND m.{column} IS NOT NULL
-                ORDER BY m.{column} DESC
-                LIMIT 1
-                """,
-            )
-            row = cursor.fetchone()
-            if row:
-                results.append({
-                    "duration_seconds": duration_s,
-                    "duration_label": label,
-                    "best_watts": row["power"],
-                    "activity_id": row["activity_id"],
-                    "activity_date": row["activity_date"],
-                })
-            else:
-                results.append({
-                    "duration_seconds": duration_s,
-                    "duration_label": label,
-                    "best_watts": None,
-                    "activity_id": None,
-                    "activity_date": None,
-                })
+        for duration_s, label, column in ROWING_POWER_TARGETS:
+            row = best.get(column)
+            results.append({
+                "duration_seconds": duration_s,
+                "duration_label": label,
+                "best_watts": row["value"] if row else None,
+                "activity_id": row["activity_id"] if row else None,
+                "activity_date": row["activity_date"] if row else None,
+            })
 
         return results
 
@@ -1042,132 +1376,49 @@ class Repository:
         - distance_prs: list of dicts with best time for each distance
         - time_prs: list of dicts with best distance for each duration
         - power_prs: list of dicts with best power for each duration
+
+        Reads rowing_pr_cache, falling back to a single UNION ALL query over
+        activity_metrics when the cache has nothing for the range.
         """
-        # Distance PRs: best (lowest) time for each distance
-        distance_targets = [
-            (500, "500m", "rowing_500m_time"),
-            (1000, "1k", "rowing_1k_time"),
-            (2000, "2k", "rowing_2k_time"),
-            (5000, "5k", "rowing_5k_time"),
-            (10000, "10k", "rowing_10k_time"),
-        ]
+        best = self._get_cached_rowing_prs(start_date, end_date) or self._get_best_rowing_metrics(
+            start_date=start_date, end_date=end_date
+        )
 
+        # Distance PRs: best (lowest) time for each distance
         distance_prs = []
-        for target_m, label, column in distance_targets:
-            cursor = self.conn.execute(
-                f"""
-                SELECT m.{column} as time, a.id as activity_id, DATE(a.start_time) as activity_date
-                FROM activity_metrics m
-                JOIN activities a ON m.activity_id = a.id
-                WHERE a.activity_type = 'row'
-                  AND DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
-                  AND m.{column} IS NOT NULL
-                ORDER BY m.{column} ASC
-                LIMIT 1
-                """,
-                (start_date.isoformat(), end_date.isoformat()),
-            )
-            row = cursor.fetchone()
-            if row:
-                distance_prs.append({
-                    "distance_meters": target_m,
-                    "distance_label": label,
-                    "total_seconds": row["time"],
-                    "activity_id": row["activity_id"],
-                    "activity_date": row["activity_date"],
-                })
-            else:
-                distance_prs.append({
-                    "distance_meters": target_m,
-                    "distance_label": label,
-                    "total_seconds": None,
-                    "activity_id": None,
-                    "activity_date": None,
-                })
+        for target_m, label, column in ROWING_DISTANCE_TARGETS:
+            row = best.get(column)
+            distance_prs.append({
+                "distance_meters": target_m,
+                "distance_label": label,
+                "total_seconds": row["value"] if row else None,
+                "activity_id": row["activity_id"] if row else None,
+                "activity_date": row["activity_date"] if row else None,
+            })
 
         # Time PRs: best (highest) distance for each duration
-        time_targets = [
-            (60, "1min", "rowing_1min_distance"),
-            (240, "4min", "rowing_4min_distance"),
-            (600, "10min", "rowing_10min_distance"),
-            (1200, "20min", "rowing_20min_distance"),
-            (1800, "30min", "rowing_30min_distance"),
-            (3600, "60min", "rowing_60min_distance"),
-        ]
-
         time_prs = []
-        for target_s, label, column in time_targets:
-            cursor = self.conn.execute(
-                f"""
-                SELECT m.{column} as distance, a.id as activity_id, DATE(a.start_time) as activity_date
-                FROM activity_metrics m
-                JOIN activities a ON m.activity_id = a.id
-                WHERE a.activity_type = 'row'
-                  AND DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
-                  AND m.{column} IS NOT NULL
-                ORDER BY m.{column} DESC
-                LIMIT 1
-                """,
-                (start_date.isoformat(), end_date.isoformat()),
-            )
-            row = cursor.fetchone()
-            if row:
-                time_prs.append({
-                    "duration_seconds": target_s,
-                    "duration_label": label,
-                    "best_distance_meters": row["distance"],
-                    "activity_id": row["activity_id"],
-                    "activity_date": row["activity_date"],
-                })
-            else:
-                time_prs.append({
-                    "duration_seconds": target_s,
-                    "duration_label": label,
-                    "best_distance_meters": None,
-                    "activity_id": None,
-                    "activity_date": None,
-                })
+        for target_s, label, column in ROWING_TIME_TARGETS:
+            row = best.get(column)
+            time_prs.append({
+                "duration_seconds": target_s,
+                "duration_label": label,
+                "best_distance_meters": row["value"] if row else None,
+                "activity_id": row["activity_id"] if row else None,
+                "activity_date": row["activity_date"] if row else None,
+            })
 
         # Power PRs: best (highest) power for each duration
-        power_targets = [
-            (60, "1min", "peak_power_1min"),
-            (240, "4min", "peak_power_4min"),
-            (1800, "30min", "peak_power_30min"),
-            (3600, "60min", "peak_power_60min"),
-        ]
-
         power_prs = []
-        for target_s, label, column in power_targets:
-            cursor = self.conn.execute(
-                f"""
-                SELECT m.{column} as power, a.id as activity_id, DATE(a.start_time) as activity_date
-                FROM activity_metrics m
-                JOIN activities a ON m.activity_id = a.id
-                WHERE a.activity_type = 'row'
-                  AND DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
-                  AND m.{column} IS NOT NULL
-                ORDER BY m.{column} DESC
-                LIMIT 1
-                """,
-                (start_date.isoformat(), end_date.isoformat()),
-            )
-            row = cursor.fetchone()
-            if row:
-                power_prs.append({
-                    "duration_seconds": target_s,
-                    "duration_label": label,
-                    "best_watts": row["power"],
-                    "activity_id": row["activity_id"],
-                    "activity_date": row["activity_date"],
-                })
-            else:
-                power_prs.append({
-                    "duration_seconds": target_s,
-                    "duration_label": label,
-                    "best_watts": None,
-                    "activity_id": None,
-                    "activity_date": None,
-                })
+        for target_s, label, column in ROWING_POWER_TARGETS:
+            row = best.get(column)
+            power_prs.append({
+                "duration_seconds": target_s,
+                "duration_label": label,
+                "best_watts": row["value"] if row else None,
+                "activity_id": row["activity_id"] if row else None,
+                "activity_date": row["activity_date"] if row else None,
+            })
 
         return {
             "distance_prs": distance_prs,
@@ -1177,36 +1428,53 @@ class Repository:
 
     def delete_activities_only(self) -> dict:
         """Delete activities and related data, preserving planned workouts. Returns counts deleted."""
-        # Unlink completed activities from planned workouts
-        self.conn.execute("""
-            UPDATE planned_workouts
-            SET completed_activity_id = NULL, status = 'planned'
-            WHERE completed_activity_id IS NOT NULL
-        """)
-        # Delete activity-related feedback
-        feedback_count = self.conn.execute("DELETE FROM workout_feedback WHERE activity_id IS NOT NULL").rowcount
-        # Delete activity metrics (would be cascade but explicit is clearer)
-        activity_metrics_count = self.conn.execute("DELETE FROM activity_metrics").rowcount
-        # Delete daily metrics
-        daily_metrics_count = self.conn.execute("DELETE FROM daily_metrics").rowcount
-        # Delete activities
-        activities_count = self.conn.execute("DELETE FROM activities").rowcount
-        self.conn.commit()
+        with self.conn:
+            row = self.conn.execute(
+                """
+                SELECT
+                    (SELECT n FROM activity_counter WHERE id = 1),
+                    (SELECT COUNT(*) FROM activity_metrics),
+                    (SELECT COUNT(*) FROM daily_metrics),
+                    (SELECT COUNT(*) FROM workout_feedback WHERE activity_id IS NOT NULL)
+                """
+            ).fetchone()
+            # Unlink completed activities from planned workouts
+            self.conn.execute("""
+                UPDATE planned_workouts
+                SET completed_activity_id = NULL, status = 'planned'
+                WHERE completed_activity_id IS NOT NULL
+            """)
+            # Delete activity-related feedback
+            self.conn.execute("DELETE FROM workout_feedback WHERE activity_id IS NOT NULL")
+            # Delete activity metrics (would be cascade but explicit is clearer)
+            self.conn.execute("DELETE FROM activity_metrics")
+            # Delete daily metrics
+            self.conn.execute("DELETE FROM daily_metrics")
+            # Delete activities
+            self.conn.execute("DELETE FROM activity_blobs")
+            self.conn.execute("DELETE FROM rowing_pr_cache")
+            self.conn.execute("DELETE FROM pain_rollup")
+            self.conn.execute("DELETE FROM activities")
+        self._agg_cache.clear()
+        self._activity_cache.clear()
         return {
-            "activities": activities_count,
-            "activity_metrics": activity_metrics_count,
-            "daily_metrics": daily_metrics_count,
-            "workout_feedback": feedback_count,
+            "activities": row[0] or 0,
+            "activity_metrics": row[1],
+            "daily_metrics": row[2],
+            "workout_feedback": row[3],
         }
 
     # --- User Settings (Wellness) ---
 
     def get_user_settings(self) -> UserSettings:
-        """Get user settings, creating default if none exists."""
+        """Get user settings, creating default if none exists (cached until updated)."""
+        if self._settings_cache is not None:
+            return self._settings_cache.model_copy()
+
         cursor = self.conn.execute("SELECT * FROM user_settings LIMIT 1")
         row = cursor.fetchone()
         if row:
-            return UserSettings(
+            self._settings_cache = UserSettings(
                 id=row["id"],
                 morning_checkin_enabled=bool(row["morning_checkin_enabled"]),
                 morning_sleep_quality_enabled=bool(row["morning_sleep_quality_enabled"]),
@@ -1220,74 +1488,60 @@ class Repository:
                 post_workout_session_feel_enabled=bool(row["post_workout_session_feel_enabled"]),
                 post_workout_notes_enabled=bool(row["post_workout_notes_enabled"]),
             )
-        return UserSettings()
+        else:
+            self._settings_cache = UserSettings()
+        return self._settings_cache.model_copy()
 
     def update_user_settings(self, settings: UserSettings) -> UserSettings:
         """Update user settings, creating if none exists."""
-        existing = self.conn.execute("SELECT id FROM user_settings LIMIT 1").fetchone()
-
-        if existing:
-            self.conn.execute(
-                """
-                UPDATE user_settings SET
-                    morning_checkin_enabled = ?,
-                    morning_sleep_quality_enabled = ?,
-                    morning_sleep_hours_enabled = ?,
-                    morning_muscle_soreness_enabled = ?,
-                    morning_energy_enabled = ?,
-                    morning_mood_enabled = ?,
-                    post_workout_feedback_enabled = ?,
-                    post_workout_rpe_enabled = ?,
-                    post_workout_pain_enabled = ?,
-                    post_workout_session_feel_enabled = ?,
-                    post_workout_notes_enabled = ?
-                WHERE id = ?
-                """,
-                (
-                    settings.morning_checkin_enabled,
-                    settings.morning_sleep_quality_enabled,
-                    settings.morning_sleep_hours_enabled,
-                    settings.morning_muscle_soreness_enabled,
-                    settings.morning_energy_enabled,
-                    settings.morning_mood_enabled,
-                    settings.post_workout_feedback_enabled,
-                    settings.post_workout_rpe_enabled,
-                    settings.post_workout_pain_enabled,
-                    settings.post_workout_session_feel_enabled,
-                    settings.post_workout_notes_enabled,
-                    existing["id"],
-                ),
-            )
-            settings.id = existing["id"]
-        else:
-            cursor = self.conn.execute(
-                """
-                INSERT INTO user_settings (
-                    morning_checkin_enabled, morning_sleep_quality_enabled,
-                    morning_sleep_hours_enabled, morning_muscle_soreness_enabled,
-                    morning_energy_enabled, morning_mood_enabled,
-                    post_workout_feedback_enabled, post_workout_rpe_enabled,
-                    post_workout_pain_enabled, post_workout_session_feel_enabled,
-                    post_workout_notes_enabled
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    settings.morning_checkin_enabled,
-                    settings.morning_sleep_quality_enabled,
-                    settings.morning_sleep_hours_enabled,
-                    settings.morning_muscle_soreness_enabled,
-                    settings.morning_energy_enabled,
-                    settings.morning_mood_enabled,
-                    settings.post_workout_feedback_enabled,
-                    settings.post_workout_rpe_enabled,
-                    settings.post_workout_pain_enabled,
-                    settings.post_workout_session_feel_enabled,
-                    settings.post_workout_notes_enabled,
-                ),
+        # Single-row table: reuse the existing row's id (or 1 for the first
+        # write) so the insert turns into an update on conflict.
+        cursor = self.conn.execute(
+            """
+            INSERT INTO user_settings (
+                id,
+                morning_checkin_enabled, morning_sleep_quality_enabled,
+                morning_sleep_hours_enabled, morning_muscle_soreness_enabled,
+                morning_energy_enabled, morning_mood_enabled,
+                post_workout_feedback_enabled, post_workout_rpe_enabled,
+                post_workout_pain_enabled, post_workout_session_feel_enabled,
+                post_workout_notes_enabled
+            ) VALUES (
+                COALESCE((SELECT id FROM user_settings LIMIT 1), 1),
+                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
             )
-            settings.id = cursor.lastrowid
+            ON CONFLICT(id) DO UPDATE SET
+                morning_checkin_enabled = excluded.morning_checkin_enabled,
+                morning_sleep_quality_enabled = excluded.morning_sleep_quality_enabled,
+                morning_sleep_hours_enabled = excluded.morning_sleep_hours_enabled,
+                morning_muscle_soreness_enabled = excluded.morning_muscle_soreness_enabled,
+                morning_energy_enabled = excluded.morning_energy_enabled,
+                morning_mood_enabled = excluded.morning_mood_enabled,
+                post_workout_feedback_enabled = excluded.post_workout_feedback_enabled,
+                post_workout_rpe_enabled = excluded.post_workout_rpe_enabled,
+                post_workout_pain_enabled = excluded.post_workout_pain_enabled,
+                post_workout_session_feel_enabled = excluded.post_workout_session_feel_enabled,
+                post_workout_notes_enabled = excluded.post_workout_notes_enabled
+            RETURNING id
+            """,
+            (
+                settings.morning_checkin_enabled,
+                settings.morning_sleep_quality_enabled,
+                settings.morning_sleep_hours_enabled,
+                settings.morning_muscle_soreness_enabled,
+                settings.morning_energy_enabled,
+                settings.morning_mood_enabled,
+                settings.post_workout_feedback_enabled,
+                settings.post_workout_rpe_enabled,
+                settings.post_workout_pain_enabled,
+                settings.post_workout_session_feel_enabled,
+                settings.post_workout_notes_enabled,
+            ),
+        )
+        settings.id = cursor.fetchone()[0]
 
         self.conn.commit()
+        self._settings_cache = settings.model_copy()
         return settings
 
     # --- Morning Check-in ---
@@ -1302,67 +1556,45 @@ class Repository:
         if row:
             return MorningCheckin(
                 id=row["id"],
-                checkin_date=date.fromisoformat(row["checkin_date"]),
+                checkin_date=row["checkin_date"],
                 sleep_quality=row["sleep_quality"],
                 sleep_hours=row["sleep_hours"],
                 muscle_soreness=row["muscle_soreness"],
                 energy_level=row["energy_level"],
                 mood=row["mood"],
                 notes=row["notes"],
-                created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
+                created_at=row["created_at"],
             )
         return None
 
     def upsert_morning_checkin(self, checkin: MorningCheckin) -> MorningCheckin:
         """Insert or update morning check-in for a date."""
-        existing = self.conn.execute(
-            "SELECT id FROM morning_checkin WHERE checkin_date = ?",
-            (checkin.checkin_date.isoformat(),),
-        ).fetchone()
-
-        if existing:
-            self.conn.execute(
-                """
-                UPDATE morning_checkin SET
-                    sleep_quality = ?,
-                    sleep_hours = ?,
-                    muscle_soreness = ?,
-                    energy_level = ?,
-                    mood = ?,
-                    notes = ?
-                WHERE id = ?
-                """,
-                (
-                    checkin.sleep_quality,
-                    checkin.sleep_hours,
-                    checkin.muscle_soreness,
-                    checkin.energy_level,
-                    checkin.mood,
-                    checkin.notes,
-                    existing["id"],
-                ),
-            )
-            checkin.id = existing["id"]
-        else:
-            cursor = self.conn.execute(
-                """
-                INSERT INTO morning_checkin (
-                    checkin_date, sleep_quality, sleep_hours,
-                    muscle_soreness, energy_level, mood, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    checkin.checkin_date.isoformat(),
-                    checkin.sleep_quality,
-                    checkin.sleep_hours,
-                    checkin.muscle_soreness,
-                    checkin.energy_level,
-                    checkin.mood,
-                    checkin.notes,
-                ),
-            )
-            checkin.id = cursor.lastrowid
-
+        cursor = self.conn.execute(
+            """
+            INSERT INTO morning_checkin (
+                checkin_date, sleep_quality, sleep_hours,
+                muscle_soreness, energy_level, mood, notes
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(checkin_date) DO UPDATE SET
+                sleep_quality = excluded.sleep_quality,
+                sleep_hours = excluded.sleep_hours,
+                muscle_soreness = excluded.muscle_soreness,
+                energy_level = excluded.energy_level,
+                mood = excluded.mood,
+                notes = excluded.notes
+            RETURNING id
+            """,
+            (
+                checkin.checkin_date.isoformat(),
+                checkin.sleep_quality,
+                checkin.sleep_hours,
+                checkin.muscle_soreness,
+                checkin.energy_level,
+                checkin.mood,
+                checkin.notes,
+            ),
+        )
+        checkin.id = cursor.fetchone()[0]
         self.conn.commit()
         return checkin
 
@@ -1377,17 +1609,17 @@ class Repository:
             (start_date.isoformat(), end_date.isoformat()),
         )
         checkins = []
-        for row in cursor.fetchall():
+        for row in cursor:
             checkins.append(MorningCheckin(
                 id=row["id"],
-                checkin_date=date.fromisoformat(row["checkin_date"]),
+                checkin_date=row["checkin_date"],
                 sleep_quality=row["sleep_quality"],
                 sleep_hours=row["sleep_hours"],
                 muscle_soreness=row["muscle_soreness"],
                 energy_level=row["energy_level"],
                 mood=row["mood"],
                 notes=row["notes"],
-                created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
+                created_at=row["created_at"],
             ))
         return checkins
 
@@ -1397,14 +1629,15 @@ class Repository:
         """Get activities from the last N days that don't have feedback."""
         start_date = date.today() - timedelta(days=days)
         cursor = self.conn.execute(
-            """
-            SELECT a.* FROM activities a
-            LEFT JOIN workout_feedback wf ON a.id = wf.activity_id
-            WHERE DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
-              AND wf.id IS NULL
+            f"""
+            SELECT {ACTIVITY_SELECT_A} FROM activities a
+            WHERE a.start_time >= ? AND a.start_time < ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM workout_feedback wf WHERE wf.activity_id = a.id
+              )
             ORDER BY a.start_time DESC
             """,
-            (start_date.isoformat(), date.today().isoformat()),
+            _day_bounds(start_date, date.today()),
         )
         return [self._row_to_activity(row) for row in cursor.fetchall()]
 
@@ -1431,7 +1664,7 @@ class Repository:
         cursor = self.conn.execute(
             """
             SELECT
-                DATE(a.start_time) as date,
+                a.start_date as date,
                 wf.pain_location,
                 wf.pain_severity,
                 a.activity_type,
@@ -1440,51 +1673,47 @@ class Repository:
             FROM workout_feedback wf
             JOIN activities a ON wf.activity_id = a.id
             WHERE wf.has_pain = 1
-              AND DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
+              AND a.start_time >= ? AND a.start_time < ?
             ORDER BY a.start_time DESC
             """,
-            (start_date.isoformat(), end_date.isoformat()),
+            _day_bounds(start_date, end_date),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
     def get_pain_summary_by_location(self, start_date: date, end_date: date) -> list[dict]:
-        """Get pain summary grouped by location."""
+        """Get pain summary grouped by location (from the daily pain rollup)."""
         cursor = self.conn.execute(
             """
             SELECT
-                wf.pain_location as location,
-                COUNT(*) as count,
-                ROUND(AVG(wf.pain_severity), 1) as avg_severity,
-                MAX(wf.pain_severity) as max_severity
-            FROM workout_feedback wf
-            JOIN activities a ON wf.activity_id = a.id
-            WHERE wf.has_pain = 1
-              AND DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
-            GROUP BY wf.pain_location
+                pain_location as location,
+                SUM(count) as count,
+                ROUND(SUM(severity_sum) * 1.0 / NULLIF(SUM(severity_count), 0), 1) as avg_severity,
+                MAX(max_severity) as max_severity
+            FROM pain_rollup
+            WHERE day >= ? AND day <= ?
+            GROUP BY pain_location
             ORDER BY count DESC
             """,
             (start_date.isoformat(), end_date.isoformat()),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
     def get_pain_summary_by_activity_type(self, start_date: date, end_date: date) -> list[dict]:
-        """Get pain summary grouped by activity type."""
+        """Get pain summary grouped by activity type (from the daily pain rollup)."""
         cursor = self.conn.execute(
             """
             SELECT
-                a.activity_type,
-                COUNT(*) as count,
-                ROUND(AVG(wf.pain_severity), 1) as avg_severity
-            FROM workout_feedback wf
-            JOIN activities a ON wf.activity_id = a.id
-            WHERE wf.has_pain = 1
-              AND DATE(a.start_time) >= ? AND DATE(a.start_time) <= ?
-            GROUP BY a.activity_type
+                activity_type,
+                SUM(count) as count,
+                ROUND(SUM(severity_sum) * 1.0 / NULLIF(SUM(severity_count), 0), 1) as avg_severity
+            FROM pain_rollup
+            WHERE day >= ? AND day <= ?
+            GROUP BY activity_type
             ORDER BY count DESC
             """,
             (start_date.isoformat(), end_date.isoformat()),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
     def get_unique_pain_locations(self) -> list[dict]:
         """Get unique pain locations with occurrence counts."""
@@ -1499,23 +1728,65 @@ class Repository:
             ORDER BY count DESC
             """
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_to_dicts(cursor)
 
-    def merge_pain_locations(self, sources: list[str], target: str) -> int:
-        """Merge multiple pain locations into a single target location.
+    def _update_pain_locations(self, sources: list[str], target: str) -> tuple[int, set[date]]:
+        """Rename pain locations without committing or refreshing the rollup.
 
-        Returns the number of updated records.
+        Returns the number of updated records and the activity days whose
+        pain rollup they affect.
         """
         if not sources:
-            return 0
+            return 0, set()
         placeholders = ",".join("?" * len(sources))
+        rows = self.conn.execute(
+            f"""
+            SELECT DISTINCT a.start_date
+            FROM workout_feedback wf
+            JOIN activities a ON wf.activity_id = a.id
+            WHERE wf.has_pain = 1 AND wf.pain_location IN ({placeholders})
+            """,
+            list(sources),
+        ).fetchall()
         cursor = self.conn.execute(
             f"""
             UPDATE workout_feedback
             SET pain_location = ?
             WHERE pain_location IN ({placeholders})
             """,
-            [target] + sources,
+            [target] + list(sources),
         )
-        self.conn.commit()
-        return cursor.rowcount
+        return cursor.rowcount, {date.fromisoformat(row[0]) for row in rows}
+
+    def merge_pain_locations(self, sources: list[str], target: str, commit: bool = True) -> int:
+        """Merge multiple pain locations into a single target location.
+
+        Pass commit=False to leave the change in the open transaction when
+        batching several merges.
+
+        Returns the number of updated records.
+        """
+        if not sources:
+            return 0
+        updated, days = self._update_pain_locations(sources, target)
+        for day in sorted(days):
+            rebuild_pain_rollup(self.conn, day)
+        if commit:
+            self.conn.commit()
+        return updated
+
+    def merge_pain_locations_many(self, merges: list[tuple[list[str], str]]) -> int:
+        """Apply several (sources, target) merges in a single transaction.
+
+        Returns the total number of updated records.
+        """
+        updated = 0
+        days: set[date] = set()
+        with self.conn:
+            for sources, target in merges:
+                merged, merged_days = self._update_pain_locations(sources, target)
+                updated += merged
+                days |= merged_days
+            for day in sorted(days):
+                rebuild_pain_rollup(self.conn, day)
+        return updated
@@ -2,12 +2,17 @@
 
 import gzip
 import hashlib
+import io
 import json
-import re
-from datetime import datetime, timezone
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import numpy as np
 from fitparse import FitFile
 
 from ..database.models import Activity
@@ -30,13 +35,15 @@ def calculate_peak_power(power_samples: list[float], window_seconds: int, sample
     if not power_samples or len(power_samples) < window_samples:
         return None
 
-    max_avg = 0.0
-    for i in range(len(power_samples) - window_samples + 1):
-        window = power_samples[i:i + window_samples]
-        avg = sum(window) / window_samples
-        if avg > max_avg:
-            max_avg = avg
+    # Slide the window by adding the entering sample and dropping the leaving one
+    window_sum = sum(power_samples[:window_samples])
+    max_sum = window_sum
+    for i in range(window_samples, len(power_samples)):
+        window_sum += power_samples[i] - power_samples[i - window_samples]
+        if window_sum > max_sum:
+            max_sum = window_sum
 
+    max_avg = max_sum / window_samples
     return round(max_avg, 1) if max_avg > 0 else None
 
 
@@ -51,24 +58,38 @@ def calculate_all_peak_powers(power_samples: list[float], include_rowing: bool =
     Returns:
         Dictionary with peak powers for standard and optionally rowing durations
     """
+    # One cumulative sum serves every window: sum(x[i:i+w]) == csum[i+w] - csum[i].
+    # Watts fit float32 exactly; accumulate in float64 to avoid drift on long rides
+    samples = np.asarray(power_samples, dtype=np.float32)
+    csum = np.concatenate(([0.0], np.cumsum(samples, dtype=np.float64)))
+    n = len(samples)
+
+    def peak(window_seconds: int) -> Optional[float]:
+        window_samples = window_seconds // sample_interval
+        # Windows longer than the activity have no peak; skip them before any array work
+        if not n or n < window_samples:
+            return None
+        max_avg = float((csum[window_samples:] - csum[:-window_samples]).max()) / window_samples
+        return round(max_avg, 1) if max_avg > 0 else None
+
     peaks = {
-        "peak_power_5s": calculate_peak_power(power_samples, 5, sample_interval),
-        "peak_power_1min": calculate_peak_power(power_samples, 60, sample_interval),
-        "peak_power_5min": calculate_peak_power(power_samples, 300, sample_interval),
-        "peak_power_20min": calculate_peak_power(power_samples, 1200, sample_interval),
+        "peak_power_5s": peak(5),
+        "peak_power_1min": peak(60),
+        "peak_power_5min": peak(300),
+        "peak_power_20min": peak(1200),
     }
 
     if include_rowing:
         peaks.update({
-            "peak_power_4min": calculate_peak_power(power_samples, 240, sample_interval),
-            "peak_power_30min": calculate_peak_power(power_samples, 1800, sample_interval),
-            "peak_power_60min": calculate_peak_power(power_samples, 3600, sample_interval),
+            "peak_power_4min": peak(240),
+            "peak_power_30min": peak(1800),
+            "peak_power_60min": peak(3600),
         })
 
     return peaks
 
 
-def calculate_normalized_power(power_samples: list[float], window_seconds: int = 30) -> Optional[float]:
+def calculate_normalized_power(power_samples: list[float] | array, window_seconds: int = 30) -> Optional[float]:
     """Calculate Normalized Power from power samples.
 
     NP algorithm:
@@ -78,7 +99,7 @@ def calculate_normalized_power(power_samples: list[float], window_seconds: int =
     4. Take the 4th root
 
     Args:
-        power_samples: List of power values (assumed 1-second samples)
+        power_samples: List or uint16 array of power values (assumed 1-second samples)
         window_seconds: Rolling average window size (default 30s)
 
     Returns:
@@ -87,19 +108,19 @@ def calculate_normalized_power(power_samples: list[float], window_seconds: int =
     if not power_samples or len(power_samples) < window_seconds:
         return None
 
-    # Calculate 30-second rolling averages
-    rolling_avgs = []
-    for i in range(len(power_samples) - window_seconds + 1):
-        window = power_samples[i:i + window_seconds]
-        avg = sum(window) / window_seconds
-        rolling_avgs.append(avg)
-
-    if not rolling_avgs:
-        return None
+    # Calculate 30-second rolling averages from a cumulative sum (O(n))
+    if isinstance(power_samples, array) and power_samples.typecode == "H":
+        # Reinterpret the array's buffer directly instead of unboxing each int
+        samples = np.frombuffer(power_samples, dtype=np.uint16).astype(np.float64)
+    else:
+        samples = np.asarray(power_samples, dtype=np.float64)
+    csum = np.cumsum(samples)
+    window_sums = csum[window_seconds - 1:].copy()
+    window_sums[1:] -= csum[:-window_seconds]
+    rolling_avgs = window_sums / window_seconds
 
     # Raise to 4th power, average, then 4th root
-    fourth_powers = [p ** 4 for p in rolling_avgs]
-    np_value = (sum(fourth_powers) / len(fourth_powers)) ** 0.25
+    np_value = float(np.mean(rolling_avgs ** 4)) ** 0.25
 
     return round(np_value, 1)
 
@@ -160,20 +181,55 @@ SPORT_TYPE_MAP = {
     "floor_climbing": "cardio",
 }
 
-# Source detection from filename patterns
+
+def _lookup_sport_type(sport: str) -> str:
+    """Map a FIT sport name to an activity type.
+
+    FIT sport names are normally lower-case already, so try them as-is
+    before paying for a lower-cased copy.
+    """
+    activity_type = SPORT_TYPE_MAP.get(sport)
+    if activity_type is None:
+        activity_type = SPORT_TYPE_MAP.get(sport.lower(), "other")
+    return activity_type
+
+
+# Source detection from filename patterns (plain substrings)
 SOURCE_PATTERNS = {
-    r"_sa_": "strava",
-    r"_gc_": "garmin",
-    r"_zw_": "zwift",
-    r"_pf_": "pebble",
-    r"_fb_": "fitbit",
+    "_sa_": "strava",
+    "_gc_": "garmin",
+    "_zw_": "zwift",
+    "_pf_": "pebble",
+    "_fb_": "fitbit",
 }
 
+# (name, value) pair of a decoded FIT field
+_name_value = attrgetter("name", "value")
+
+# Keep every Nth record message in the stored raw data to reduce its size
+RAW_RECORD_STRIDE = 5
+
+# Record fields kept in the stored raw data (those read by the map and streams endpoints)
+_RAW_RECORD_FIELDS = frozenset({
+    "timestamp",
+    "position_lat",
+    "position_long",
+    "altitude",
+    "enhanced_altitude",
+    "heart_rate",
+    "power",
+    "cadence",
+    "running_cadence",
+    "speed",
+    "enhanced_speed",
+    "distance",
+})
+
 
 def detect_source(filename: str) -> Optional[str]:
     """Detect activity source from filename pattern."""
     for pattern, source in SOURCE_PATTERNS.items():
-        if re.search(pattern, filename):
+        if pattern in filename:
             return source
     return None
 
@@ -190,37 +246,56 @@ def parse_fit_file(path: Path, include_raw_data: bool = False) -> Optional[Activ
     """
     try:
         fit = FitFile(str(path))
-        fit_bytes = path.read_bytes()
-        file_hash = hashlib.sha256(fit_bytes).hexdigest()
+        with path.open("rb") as f:
+            file_hash = hashlib.file_digest(f, "sha256").hexdigest()
 
-        # Get session message (summary data)
+        # Decode the file once, dispatching messages by type
         session_data = None
-        for record in fit.get_messages("session"):
-            session_data = {field.name: field.value for field in record.fields}
-            break
-
-        if not session_data:
-            # Try to get data from activity or record messages
-            for record in fit.get_messages("activity"):
-                session_data = {field.name: field.value for field in record.fields}
-                break
-
+        activity_data = None
+        first_record_time = None
+        # Records precede the session message, so the sample count isn't known
+        # up front; a uint16 array grows in place without boxing each reading
+        power_samples = array("H")
+        laps = []
+        records = []
+        records_until_sample = RAW_RECORD_STRIDE
+
+        for message in fit.get_messages():
+            name = message.name
+            if name == "record":
+                for field in message.fields:
+                    if field.name == "power" and field.value is not None:
+                        power_samples.append(int(field.value))
+                    elif field.name == "timestamp" and first_record_time is None and field.value:
+                        first_record_time = field.value
+                # Only every RAW_RECORD_STRIDE-th record is serialized for raw data
+                if include_raw_data:
+                    records_until_sample -= 1
+                    if not records_until_sample:
+                        records_until_sample = RAW_RECORD_STRIDE
+                        records.append({
+                            name: _serialize_value(value)
+                            for name, value in map(_name_value, message.fields)
+                            if name in _RAW_RECORD_FIELDS
+                        })
+            elif name == "lap":
+                if include_raw_data:
+                    laps.append({name: _serialize_value(value) for name, value in map(_name_value, message.fields)})
+            elif name == "session":
+                if session_data is None:
+                    session_data = dict(map(_name_value, message.fields))
+            elif name == "activity":
+                if activity_data is None:
+                    activity_data = dict(map(_name_value, message.fields))
+
+        # Session message has the summary data; fall back to the activity message
+        session_data = session_data or activity_data
         if not session_data:
             return None
+        g = session_data.get
 
-        # Extract start time
-        start_time = session_data.get("start_time") or session_data.get("timestamp")
-        if not start_time:
-            # Try to get from first record
-            for record in fit.get_messages("record"):
-                ts = None
-                for field in record.fields:
-                    if field.name == "timestamp":
-                        ts = field.value
-                        break
-                if ts:
-                    start_time = ts
-                    break
+        # Extract start time, falling back to the first record
+        start_time = g("start_time") or g("timestamp") or first_record_time
 
         if not start_time:
             return None
@@ -233,69 +308,51 @@ def parse_fit_file(path: Path, include_raw_data: bool = False) -> Optional[Activ
             return None
 
         # Determine activity type - check sub_sport first for more specific classification
-        sport = session_data.get("sport", "generic")
-        sub_sport = session_data.get("sub_sport")
+        sport = g("sport", "generic")
+        sub_sport = g("sub_sport")
 
         activity_type = "other"
         if isinstance(sub_sport, str):
-            activity_type = SPORT_TYPE_MAP.get(sub_sport.lower(), "other")
+            activity_type = _lookup_sport_type(sub_sport)
         if activity_type == "other" and isinstance(sport, str):
-            activity_type = SPORT_TYPE_MAP.get(sport.lower(), "other")
+            activity_type = _lookup_sport_type(sport)
 
         # Calculate end time
-        duration = session_data.get("total_elapsed_time") or session_data.get("total_timer_time", 0)
+        duration = g("total_elapsed_time") or g("total_timer_time", 0)
         if duration:
-            end_time = start_time.replace() + __import__("datetime").timedelta(seconds=duration)
+            end_time = start_time + timedelta(seconds=duration)
         else:
             end_time = None
 
         # Extract normalized power for cycling activities only
         is_cycling = activity_type == "cycle"
         normalized_power = None
-        power_samples = []
 
         if is_cycling:
             # First check if NP is in the session data
-            normalized_power = session_data.get("normalized_power")
+            normalized_power = g("normalized_power")
 
-            # If not, calculate from power samples
-            if not normalized_power and session_data.get("avg_power"):
-                # Need to read power samples from records
-                fit_for_records = FitFile(str(path))
-                for record in fit_for_records.get_messages("record"):
-                    for field in record.fields:
-                        if field.name == "power" and field.value is not None:
-                            power_samples.append(field.value)
-                            break
-
-                if power_samples:
-                    normalized_power = calculate_normalized_power(power_samples)
+            # If not, calculate from the power samples collected above
+            if not normalized_power and g("avg_power") and power_samples:
+                normalized_power = calculate_normalized_power(power_samples)
 
         # Build raw data for storage if requested
         raw_fit_data = None
         if include_raw_data:
             raw_data = {
-                "session": session_data,
-                "laps": [],
-                "records": [],
+                "session": {name: _serialize_value(value) for name, value in session_data.items()},
+                "laps": laps,
+                "records": records,
             }
 
-            # Collect lap data
-            for lap in fit.get_messages("lap"):
-                lap_data = {field.name: _serialize_value(field.value) for field in lap.fields}
-                raw_data["laps"].append(lap_data)
-
-            # Collect record data (sample every 5th record to reduce size)
-            record_count = 0
-            for record in fit.get_messages("record"):
-                record_count += 1
-                if record_count % 5 == 0:  # Sample every 5th record
-                    record_data = {field.name: _serialize_value(field.value) for field in record.fields}
-                    raw_data["records"].append(record_data)
-
-            # Compress the JSON data
-            json_str = json.dumps(raw_data, default=str)
-            raw_fit_data = gzip.compress(json_str.encode("utf-8"))
+            # Stream the JSON straight into the compressor rather than building
+            # the full string first; level 1 keeps bulk imports fast
+            buffer = io.BytesIO()
+            with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=1) as gz:
+                with io.TextIOWrapper(gz, encoding="utf-8") as text:
+                    # Values are pre-serialized; default=str only catches stray types
+                    json.dump(raw_data, text, separators=(",", ":"), default=str)
+            raw_fit_data = buffer.getvalue()
 
         return Activity(
             fit_file_hash=file_hash,
@@ -305,18 +362,18 @@ def parse_fit_file(path: Path, include_raw_data: bool = False) -> Optional[Activ
             activity_type=activity_type,
             source=detect_source(path.name),
             duration_seconds=duration or 0,
-            distance_meters=session_data.get("total_distance"),
-            avg_speed_mps=session_data.get("avg_speed") or session_data.get("enhanced_avg_speed"),
-            max_speed_mps=session_data.get("max_speed") or session_data.get("enhanced_max_speed"),
-            total_ascent_m=session_data.get("total_ascent"),
-            total_descent_m=session_data.get("total_descent"),
-            avg_hr=session_data.get("avg_heart_rate"),
-            max_hr=session_data.get("max_heart_rate"),
-            avg_power=session_data.get("avg_power"),
-            max_power=session_data.get("max_power"),
+            distance_meters=g("total_distance"),
+            avg_speed_mps=g("avg_speed") or g("enhanced_avg_speed"),
+            max_speed_mps=g("max_speed") or g("enhanced_max_speed"),
+            total_ascent_m=g("total_ascent"),
+            total_descent_m=g("total_descent"),
+            avg_hr=g("avg_heart_rate"),
+            max_hr=g("max_heart_rate"),
+            avg_power=g("avg_power"),
+            max_power=g("max_power"),
             normalized_power=normalized_power,
-            avg_cadence=session_data.get("avg_cadence") or session_data.get("avg_running_cadence"),
-            calories=session_data.get("total_calories"),
+            avg_cadence=g("avg_cadence") or g("avg_running_cadence"),
+            calories=g("total_calories"),
             title=_generate_title(activity_type, start_time, session_data),
             raw_fit_data=raw_fit_data,
         )
@@ -335,89 +392,144 @@ def _serialize_value(value):
     return value
 
 
+# Display names used in generated activity titles
+_TYPE_NAMES = {
+    "run": "Run",
+    "cycle": "Ride",
+    "swim": "Swim",
+    "walk": "Walk",
+    "hike": "Hike",
+    "strength": "Strength",
+    "cardio": "Cardio",
+    "yoga": "Yoga",
+    "row": "Row",
+    "ski": "Ski",
+    "xcski": "XC Ski",
+    "snowboard": "Snowboard",
+    "skate": "Skate",
+    "tennis": "Tennis",
+    "golf": "Golf",
+    "sup": "SUP",
+    "surf": "Surf",
+    "kitesurf": "Kitesurf",
+    "windsurf": "Windsurf",
+    "wakeboard": "Wakeboard",
+    "climb": "Climb",
+    "paddle": "Paddle",
+    "sail": "Sail",
+    "other": "Activity",
+}
+
+
 def _generate_title(activity_type: str, start_time: datetime, session_data: dict) -> str:
     """Generate a title for the activity."""
-    time_of_day = "Morning" if start_time.hour < 12 else "Afternoon" if start_time.hour < 17 else "Evening"
-    type_names = {
-        "run": "Run",
-        "cycle": "Ride",
-        "swim": "Swim",
-        "walk": "Walk",
-        "hike": "Hike",
-        "strength": "Strength",
-        "cardio": "Cardio",
-        "yoga": "Yoga",
-        "row": "Row",
-        "ski": "Ski",
-        "xcski": "XC Ski",
-        "snowboard": "Snowboard",
-        "skate": "Skate",
-        "tennis": "Tennis",
-        "golf": "Golf",
-        "sup": "SUP",
-        "surf": "Surf",
-        "kitesurf": "Kitesurf",
-        "windsurf": "Windsurf",
-        "wakeboard": "Wakeboard",
-        "climb": "Climb",
-        "paddle": "Paddle",
-        "sail": "Sail",
-        "other": "Activity",
-    }
-    type_name = type_names.get(activity_type, "Activity")
+    hour = start_time.hour
+    time_of_day = "Morning" if hour < 12 else "Afternoon" if hour < 17 else "Evening"
+    type_name = _TYPE_NAMES.get(activity_type, "Activity")
     return f"{time_of_day} {type_name}"
 
 
-def extract_distance_time_series(path: Path) -> list[tuple[float, float]]:
+def read_fit_records(path: Path) -> tuple:
+    """Decode all record messages of a FIT file.
+
+    Decode once and pass the result to extract_power_samples_from_fit and
+    extract_distance_time_series when both run on the same file.
+
+    Returns:
+        Tuple of record messages; empty if the file is missing or unreadable
+    """
+    try:
+        return tuple(FitFile(str(path)).get_messages("record"))
+    except Exception:
+        return ()
+
+
+def extract_distance_time_series(path: Path, records: Optional[tuple] = None) -> np.ndarray:
     """Extract distance/time series from a FIT file.
 
     Args:
         path: Path to the FIT file
+        records: Record messages from read_fit_records, to skip decoding the file again
 
     Returns:
-        List of (cumulative_distance_meters, elapsed_seconds) tuples
+        Array of shape (n, 2) with (cumulative_distance_meters, elapsed_seconds) rows
     """
-    if not path.exists():
-        return []
+    if records is None:
+        records = read_fit_records(path)
 
     try:
-        fit = FitFile(str(path))
         series = []
         start_time = None
 
-        for record in fit.get_messages("record"):
-            fields = {f.name: f.value for f in record.fields}
-            if "distance" in fields and "timestamp" in fields:
-                distance = fields["distance"]
-                timestamp = fields["timestamp"]
-                if distance is not None and timestamp is not None:
-                    if start_time is None:
-                        start_time = timestamp
-                    elapsed = (timestamp - start_time).total_seconds()
-                    series.append((distance, elapsed))
-
-        return series
+        for record in records:
+            # Scan the fields once for the two we need rather than building a dict
+            distance = timestamp = None
+            for field in record.fields:
+                if field.name == "distance":
+                    distance = field.value
+                elif field.name == "timestamp":
+                    timestamp = field.value
+            if distance is not None and timestamp is not None:
+                if start_time is None:
+                    start_time = timestamp
+                elapsed = (timestamp - start_time).total_seconds()
+                series.append((distance, elapsed))
+
+        return np.array(series, dtype=np.float64).reshape(-1, 2)
     except Exception:
-        return []
+        return np.empty((0, 2))
+
+
+def _window_deltas(keys: np.ndarray, values: np.ndarray, span: float) -> np.ndarray:
+    """Change in values over the next `span` of keys, for every start index.
+
+    For each start, the window ends at the first sample whose key reaches
+    start_key + span; the end value is linearly interpolated between that
+    sample and the one before it. Keys must be non-decreasing, which makes
+    every end index a single vectorized binary search. Starts whose window
+    runs past the last sample are dropped.
+    """
+    targets = keys + span
+    ends = np.searchsorted(keys, targets, side="left")
+    starts = np.flatnonzero(ends < len(keys))
+    if not len(starts):
+        return np.empty(0)
 
+    ends = ends[starts]
+    targets = targets[starts]
+    prevs = np.maximum(ends - 1, 0)
+    gaps = keys[ends] - keys[prevs]
 
-def calculate_best_effort_time(distance_time_series: list[tuple[float, float]], target_distance: float, tolerance: float = 0.01) -> Optional[float]:
+    # Interpolate where there is a preceding sample with a distinct key
+    interpolate = (ends > 0) & (gaps > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fractions = (targets - keys[prevs]) / gaps
+        interpolated = values[prevs] + fractions * (values[ends] - values[prevs])
+    end_values = np.where(interpolate, interpolated, values[ends])
+
+    return end_values - values[starts]
+
+
+def calculate_best_effort_time(distance_time_series: list[tuple[float, float]] | np.ndarray, target_distance: float, tolerance: float = 0.01) -> Optional[float]:
     """Find the best (fastest) time to cover a target distance using sliding window.
 
     Args:
-        distance_time_series: List of (cumulative_distance, elapsed_seconds) tuples
+        distance_time_series: (cumulative_distance, elapsed_seconds) pairs, as a list or (n, 2) array
         target_distance: Target distance in meters
         tolerance: Fraction of target distance to allow as shortfall (default 1%)
 
     Returns:
         Best time in seconds to cover the target distance, or None if not possible
     """
-    if not distance_time_series:
+    if len(distance_time_series) == 0:
         return None
 
-    first_distance = distance_time_series[0][0]
-    max_distance = distance_time_series[-1][0]
-    total_covered = max_distance - first_distance
+    series = np.asarray(distance_time_series, dtype=np.float64)
+    # Cumulative distance should never drop; clamp any device glitches so it can be binary searched
+    distances = np.maximum.accumulate(series[:, 0])
+    times = series[:, 1]
+
+    total_covered = distances[-1] - distances[0]
     min_required = target_distance * (1 - tolerance)
 
     # Not enough distance covered
@@ -427,63 +539,33 @@ def calculate_best_effort_time(distance_time_series: list[tuple[float, float]],
     # If the whole activity is within tolerance of target, return total time
     # (handles test pieces that are exactly the target distance)
     if total_covered < target_distance and total_covered >= min_required:
-        total_time = distance_time_series[-1][1] - distance_time_series[0][1]
-        return round(total_time, 1)
+        total_time = times[-1] - times[0]
+        return round(float(total_time), 1)
 
     # Otherwise use sliding window to find best effort
-    effective_target = target_distance
-
-    best_time = None
-    end_idx = 0
-
-    for start_idx, (start_dist, start_time) in enumerate(distance_time_series):
-        # Find the first point where distance >= start_dist + effective_target
-        while end_idx < len(distance_time_series):
-            end_dist, end_time = distance_time_series[end_idx]
-            if end_dist >= start_dist + effective_target:
-                # Interpolate for more accurate time
-                if end_idx > 0:
-                    prev_dist, prev_time = distance_time_series[end_idx - 1]
-                    if end_dist > prev_dist:
-                        # Linear interpolation to find exact time at target distance
-                        target_dist = start_dist + effective_target
-                        fraction = (target_dist - prev_dist) / (end_dist - prev_dist)
-                        interpolated_time = prev_time + fraction * (end_time - prev_time)
-                        elapsed = interpolated_time - start_time
-                    else:
-                        elapsed = end_time - start_time
-                else:
-                    elapsed = end_time - start_time
-
-                if best_time is None or elapsed < best_time:
-                    best_time = elapsed
-                break
-            end_idx += 1
-
-        # Reset end_idx to search from current position (optimization)
-        if end_idx > start_idx:
-            end_idx = start_idx + 1
-
-    return round(best_time, 1) if best_time is not None else None
-
-
-def calculate_best_effort_distance(distance_time_series: list[tuple[float, float]], target_seconds: float, tolerance: float = 0.01) -> Optional[float]:
+    elapsed = _window_deltas(distances, times, target_distance)
+    return round(float(elapsed.min()), 1) if len(elapsed) else None
+
+
+def calculate_best_effort_distance(distance_time_series: list[tuple[float, float]] | np.ndarray, target_seconds: float, tolerance: float = 0.01) -> Optional[float]:
     """Find the best (longest) distance covered in a target time using sliding window.
 
     Args:
-        distance_time_series: List of (cumulative_distance, elapsed_seconds) tuples
+        distance_time_series: (cumulative_distance, elapsed_seconds) pairs, as a list or (n, 2) array
         target_seconds: Target time in seconds
         tolerance: Fraction of target time to allow as shortfall (default 1%)
 
     Returns:
         Best distance in meters covered in the target time, or None if not possible
     """
-    if not distance_time_series:
+    if len(distance_time_series) == 0:
         return None
 
-    first_time = distance_time_series[0][1]
-    max_time = distance_time_series[-1][1]
-    total_duration = max_time - first_time
+    series = np.asarray(distance_time_series, dtype=np.float64)
+    distances = series[:, 0]
+    times = np.maximum.accumulate(series[:, 1])
+
+    total_duration = times[-1] - times[0]
     min_required = target_seconds * (1 - tolerance)
 
     # Not enough duration
@@ -492,68 +574,45 @@ def calculate_best_effort_distance(distance_time_series: list[tuple[float, float
 
     # If the whole activity is within tolerance of target, return total distance
     if total_duration < target_seconds and total_duration >= min_required:
-        total_distance = distance_time_series[-1][0] - distance_time_series[0][0]
-        return round(total_distance, 1)
+        total_distance = distances[-1] - distances[0]
+        return round(float(total_distance), 1)
 
     # Otherwise use sliding window to find best effort
-    best_distance = None
-    end_idx = 0
-
-    for start_idx, (start_dist, start_time) in enumerate(distance_time_series):
-        # Find the first point where time >= start_time + target_seconds
-        while end_idx < len(distance_time_series):
-            end_dist, end_time = distance_time_series[end_idx]
-            if end_time >= start_time + target_seconds:
-                # Interpolate for more accurate distance
-                if end_idx > 0:
-                    prev_dist, prev_time = distance_time_series[end_idx - 1]
-                    if end_time > prev_time:
-                        # Linear interpolation to find exact distance at target time
-                        target_time = start_time + target_seconds
-                        fraction = (target_time - prev_time) / (end_time - prev_time)
-                        interpolated_dist = prev_dist + fraction * (end_dist - prev_dist)
-                        distance_covered = interpolated_dist - start_dist
-                    else:
-                        distance_covered = end_dist - start_dist
-                else:
-                    distance_covered = end_dist - start_dist
-
-                if best_distance is None or distance_covered > best_distance:
-                    best_distance = distance_covered
-                break
-            end_idx += 1
-
-        # Reset end_idx to search from current position
-        if end_idx > start_idx:
-            end_idx = start_idx + 1
-
-    return round(best_distance, 1) if best_distance is not None else None
-
-
-def extract_power_samples_from_fit(path: Path) -> tuple[list[float], int]:
+    covered = _window_deltas(times, distances, target_seconds)
+    return round(float(covered.max()), 1) if len(covered) else None
+
+
+def extract_power_samples_from_fit(path: Path, records: Optional[tuple] = None) -> tuple[np.ndarray, int]:
     """Extract power samples from a FIT file with sample interval detection.
 
     Args:
         path: Path to the FIT file
+        records: Record messages from read_fit_records, to skip decoding the file again
 
     Returns:
         Tuple of (power_samples, sample_interval_seconds)
         sample_interval is 1 for most devices, 3 for Concept2 ergs
     """
-    if not path.exists():
-        return [], 1
+    if records is None:
+        records = read_fit_records(path)
 
     try:
-        fit = FitFile(str(path))
         power_samples = []
         timestamps = []
 
-        for record in fit.get_messages("record"):
-            fields = {f.name: f.value for f in record.fields}
-            if "power" in fields and fields["power"] is not None:
-                power_samples.append(fields["power"])
-                if "timestamp" in fields:
-                    timestamps.append(fields["timestamp"])
+        for record in records:
+            # Scan the fields once for the two we need rather than building a dict
+            power = timestamp = None
+            for field in record.fields:
+                if field.name == "power":
+                    power = field.value
+                elif field.name == "timestamp":
+                    timestamp = field.value
+            if power is not None:
+                power_samples.append(power)
+                # Only the first two timestamps are used for interval detection
+                if timestamp is not None and len(timestamps) < 2:
+                    timestamps.append(timestamp)
 
         # Detect sample interval from first two timestamps
         sample_interval = 1
@@ -561,9 +620,9 @@ def extract_power_samples_from_fit(path: Path) -> tuple[list[float], int]:
             diff = (timestamps[1] - timestamps[0]).total_seconds()
             sample_interval = max(1, int(round(diff)))
 
-        return power_samples, sample_interval
+        return np.array(power_samples, dtype=np.float32), sample_interval
     except Exception:
-        return [], 1
+        return np.empty(0, dtype=np.float32), 1
 
 
 class FitImporter:
@@ -581,3 +640,22 @@ class FitImporter:
     def count_files(self) -> int:
         """Count FIT files available for import."""
         return len(self.get_fit_files())
+
+    def import_all(
+        self, include_raw_data: bool = False, workers: Optional[int] = None, chunksize: int = 8
+    ) -> Iterator[tuple[Path, Optional[Activity]]]:
+        """Parse all FIT files in parallel worker processes.
+
+        Args:
+            include_raw_data: Whether to include compressed raw FIT data
+            workers: Number of worker processes (default: CPU count)
+            chunksize: Files handed to a worker per round trip
+
+        Yields:
+            (path, activity) tuples in file order; activity is None
+            for files that failed to parse
+        """
+        paths = self.get_fit_files()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            activities = executor.map(parse_fit_file, paths, repeat(include_raw_data), chunksize=chunksize)
+            yield from zip(paths, activities)
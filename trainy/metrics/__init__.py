@@ -1,8 +1,9 @@
 """Trainy metrics calculations."""
 
-from .tss import calculate_tss, TSSMethod
+from .tss import calculate_tss, calculate_tss_batch, TSSMethod
 from .training_load import (
     calculate_training_load,
+    calculate_training_load_arrays,
     calculate_acwr,
     calculate_monotony_strain,
     get_acwr_status,
@@ -18,8 +19,10 @@ from .efficiency import (
 
 __all__ = [
     "calculate_tss",
+    "calculate_tss_batch",
     "TSSMethod",
     "calculate_training_load",
+    "calculate_training_load_arrays",
     "calculate_acwr",
     "calculate_monotony_strain",
     "get_acwr_status",
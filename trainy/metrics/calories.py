@@ -1,5 +1,9 @@
 """Caloric expenditure prediction for planned workouts."""
 
+from typing import Sequence
+
+import numpy as np
+
 
 # MET values by activity type and intensity level
 # Source: Compendium of Physical Activities
@@ -17,6 +21,15 @@ MET_VALUES = {
 # Default MET for unknown activity types
 DEFAULT_MET = {"light": 5.0, "moderate": 6.5, "vigorous": 8.0}
 
+# MET_VALUES as a lookup table for bulk prediction: one row per activity type
+# (DEFAULT_MET last), columns light/moderate/vigorous
+_MET_LEVELS = ("light", "moderate", "vigorous")
+_MET_TYPE_INDEX = {activity_type: i for i, activity_type in enumerate(MET_VALUES)}
+_MET_TABLE = np.array(
+    [[met[level] for level in _MET_LEVELS] for met in (*MET_VALUES.values(), DEFAULT_MET)]
+)
+_DEFAULT_MET_INDEX = len(MET_VALUES)
+
 
 def predict_calories(
     duration_s: float,
@@ -62,3 +75,38 @@ def predict_calories(
     calories = met * weight_kg * duration_hours
 
     return round(calories)
+
+
+def predict_calories_bulk(
+    durations_s: Sequence[float],
+    activity_types: Sequence[str],
+    intensity_factors: Sequence[float],
+    weights_kg: Sequence[float] | float,
+) -> np.ndarray:
+    """Predict caloric expenditure for many workouts at once.
+
+    Vectorized equivalent of calling predict_calories for each workout.
+
+    Args:
+        durations_s: Workout durations in seconds
+        activity_types: Activity type of each workout
+        intensity_factors: Intensity factor of each workout
+        weights_kg: Body weight in kilograms, per workout or a single value
+
+    Returns:
+        Integer array of predicted calories, one per workout
+    """
+    durations = np.asarray(durations_s, dtype=np.float64)
+    intensity = np.asarray(intensity_factors, dtype=np.float64)
+    weights = np.broadcast_to(np.asarray(weights_kg, dtype=np.float64), durations.shape)
+
+    type_idx = np.fromiter(
+        (_MET_TYPE_INDEX.get(t.lower(), _DEFAULT_MET_INDEX) for t in activity_types),
+        dtype=np.intp,
+        count=len(durations),
+    )
+    level_idx = np.where(intensity < 0.7, 0, np.where(intensity <= 0.9, 1, 2))
+    met = _MET_TABLE[type_idx, level_idx]
+
+    calories = np.round(met * weights * (durations / 3600)).astype(int)
+    return np.where((durations <= 0) | (weights <= 0), 0, calories)
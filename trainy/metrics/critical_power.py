@@ -46,9 +46,11 @@ def fit_critical_power(
         cp, w_prime, tau = params
 
         # Calculate R²
-        predicted = morton_3p_model(t, cp, w_prime, tau)
-        ss_res = np.sum((p - predicted) ** 2)
-        ss_tot = np.sum((p - np.mean(p)) ** 2)
+        # Residual sums of squares as dot products (no squared temporaries)
+        residuals = p - morton_3p_model(t, cp, w_prime, tau)
+        deviations = p - p.mean()
+        ss_res = residuals @ residuals
+        ss_tot = deviations @ deviations
         r_squared = 1 - (ss_res / ss_tot)
 
         return {
@@ -1,18 +1,46 @@
 """Training load calculations (CTL, ATL, TSB, ACWR, Monotony, Strain)."""
 
 import math
+from bisect import bisect_left
 from datetime import date, timedelta
 from enum import Enum
-from statistics import mean, stdev
 from typing import Optional
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
 from ..database.models import DailyMetrics
 
 # EWMA decay factors using true exponential formula: 1 - e^(-1/k)
 # Reference: TrainingPeaks Performance Manager (Coggan/Allen)
 # https://www.trainingpeaks.com/learn/articles/the-science-of-the-performance-manager/
-CTL_DECAY = 1 - math.exp(-1 / 42)  # ≈ 0.02353 (42-day time constant)
-ATL_DECAY = 1 - math.exp(-1 / 7)  # ≈ 0.13314 (7-day time constant)
+# Frozen as literals (exact float repr of the formula) so they read as constants
+CTL_DECAY = 0.023528313347756735  # 1 - math.exp(-1 / 42), 42-day time constant
+ATL_DECAY = 0.1331221002498184  # 1 - math.exp(-1 / 7), 7-day time constant
+
+
+# Status lookup tables: bisect_left(thresholds, value) counts the thresholds
+# strictly below value, which indexes the matching (status_name, status_color)
+_FORM_THRESHOLDS = (-30, -10, 5, 25)
+_FORM_STATUSES = (
+    ("Exhausted", "red"),
+    ("Tired", "orange"),
+    ("Neutral", "blue"),
+    ("Fresh", "green"),
+    ("Transition", "yellow"),
+)
+
+_MONOTONY_THRESHOLDS = (1.5, 2.0)
+_MONOTONY_STATUSES = (("Good", "green"), ("Elevated", "orange"), ("High Risk", "red"))
+
+_STRAIN_THRESHOLDS = (2000, 4000, 6000)
+_STRAIN_STATUSES = (("Low", "green"), ("Moderate", "yellow"), ("High", "orange"), ("Very High", "red"))
+
+# ACWR's lower bound is inclusive (0.8 is optimal): the float just below 0.8
+# makes "strictly above" mean ">= 0.8"
+_ACWR_THRESHOLDS = (math.nextafter(0.8, -math.inf), 1.3, 1.5)
+_ACWR_STATUSES = (("Undertrained", "yellow"), ("Optimal", "green"), ("Caution", "orange"), ("Danger", "red"))
 
 
 class ACWRZone(Enum):
@@ -24,6 +52,10 @@ class ACWRZone(Enum):
     DANGER = "danger"  # > 1.5
 
 
+# Zones indexed by bisect_left(_ACWR_THRESHOLDS, acwr), as for _ACWR_STATUSES
+_ACWR_ZONES = (ACWRZone.UNDERTRAINED, ACWRZone.OPTIMAL, ACWRZone.CAUTION, ACWRZone.DANGER)
+
+
 def calculate_training_load(
     daily_tss: list[tuple[date, float]],
     start_ctl: float = 0.0,
@@ -49,77 +81,125 @@ def calculate_training_load(
     if not daily_tss:
         return []
 
+    columns = calculate_training_load_arrays(daily_tss, start_ctl, start_atl)
+    days = columns.pop("date").tolist()
+
+    # NaN marks values that are missing (None) on the models
+    column_values = (
+        [None if math.isnan(value) else value for value in column.tolist()] for column in columns.values()
+    )
+    rows = zip(days, *column_values)
+    return [DailyMetrics(date=day, **dict(zip(columns, row_values))) for day, *row_values in rows]
+
+
+def calculate_training_load_arrays(
+    daily_tss: list[tuple[date, float]],
+    start_ctl: float = 0.0,
+    start_atl: float = 0.0,
+) -> dict[str, np.ndarray]:
+    """Calculate training load as columns, one array per DailyMetrics field.
+
+    Same values as calculate_training_load (gap-filled, rounded for storage),
+    laid out for charting and export without building a model per day.
+    Days without enough history for ACWR, Monotony or Strain hold NaN.
+
+    Returns:
+        Dict of arrays keyed by DailyMetrics field name; "date" is datetime64[D]
+    """
     # Sort by date
     daily_tss = sorted(daily_tss, key=lambda x: x[0])
 
-    # Fill in gaps with zero TSS days
+    # Fill in gaps with zero TSS days (relies on the sort above)
     filled_data = _fill_date_gaps(daily_tss)
+    days = np.array([day for day, _ in filled_data], dtype="datetime64[D]")
+    tss = np.array([tss for _, tss in filled_data], dtype=np.float64)
+
+    # EWMA update using true exponential decay, run as one-pole filters
+    ctl = _ewma(tss, CTL_DECAY, start_ctl)
+    atl = _ewma(tss, ATL_DECAY, start_atl)
+
+    # Rolling sums from a cumulative sum: sum(tss[i-k+1:i+1]) == csum[i+1] - csum[i-k+1]
+    csum = np.concatenate(([0.0], np.cumsum(tss)))
+    ends = np.arange(1, len(tss) + 1)
+
+    # ACWR value only (see calculate_acwr); the zone isn't stored
+    with np.errstate(divide="ignore", invalid="ignore"):
+        acwr = np.where(ctl > 0, atl / ctl, np.nan)
+
+    monotony, strain = _monotony_strain(tss)
+
+    # Round whole columns once for storage rather than per day
+    return {
+        "date": days,
+        "total_tss": tss,
+        "ctl": np.round(ctl, 1),
+        "atl": np.round(atl, 1),
+        "tsb": np.round(ctl - atl, 1),
+        "tss_7day": np.round(csum[1:] - csum[np.maximum(ends - 7, 0)], 1),
+        "tss_30day": np.round(csum[1:] - csum[np.maximum(ends - 30, 0)], 1),
+        "tss_90day": np.round(csum[1:] - csum[np.maximum(ends - 90, 0)], 1),
+        "acwr": np.round(acwr, 2),
+        "monotony": np.round(monotony, 2),
+        "strain": np.round(strain, 0),
+    }
+
+
+def _ewma(values: np.ndarray, decay: float, start: float) -> np.ndarray:
+    """Exponentially weighted moving average seeded with a starting value.
+
+    value_today = value_yesterday + (x - value_yesterday) * decay is the
+    one-pole IIR filter y[n] = decay * x[n] + (1 - decay) * y[n-1].
+    """
+    filtered, _ = lfilter([decay], [1.0, decay - 1.0], values, zi=[start * (1.0 - decay)])
+    return filtered
 
-    ctl = start_ctl
-    atl = start_atl
-    results = []
-
-    # Keep track of TSS for rolling sums
-    tss_history: list[float] = []
-
-    for day, tss in filled_data:
-        # EWMA update using true exponential decay
-        ctl = ctl + (tss - ctl) * CTL_DECAY
-        atl = atl + (tss - atl) * ATL_DECAY
-        tsb = ctl - atl
-
-        # Add to history for rolling sums
-        tss_history.append(tss)
-
-        # Calculate rolling sums
-        tss_7day = sum(tss_history[-7:])
-        tss_30day = sum(tss_history[-30:])
-        tss_90day = sum(tss_history[-90:])
-
-        # Calculate ACWR
-        acwr_value, _ = calculate_acwr(atl, ctl)
-
-        # Calculate Monotony and Strain (need 7 days of data)
-        monotony, strain_val = calculate_monotony_strain(tss_history)
-
-        results.append(
-            DailyMetrics(
-                date=day,
-                total_tss=tss,
-                ctl=round(ctl, 1),
-                atl=round(atl, 1),
-                tsb=round(tsb, 1),
-                tss_7day=round(tss_7day, 1),
-                tss_30day=round(tss_30day, 1),
-                tss_90day=round(tss_90day, 1),
-                acwr=acwr_value,
-                monotony=monotony,
-                strain=strain_val,
-            )
-        )
-
-    return results
-
-
-def _fill_date_gaps(daily_tss: list[tuple[date, float]]) -> list[tuple[date, float]]:
-    """Fill gaps in the date series with zero TSS values."""
-    if not daily_tss:
+
+def _monotony_strain(tss: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Monotony and Strain for every day over its trailing 7-day window.
+
+    Vectorized equivalent of calling calculate_monotony_strain once per day
+    (unrounded); days with fewer than 7 days of history get NaN.
+    """
+    monotony = np.full(len(tss), np.nan)
+    strain = np.full(len(tss), np.nan)
+    if len(tss) < 7:
+        return monotony, strain
+
+    windows = sliding_window_view(tss, 7)
+    std = windows.std(axis=1, ddof=1)
+    # All days identical = infinite monotony, cap at high value
+    identical = windows.max(axis=1) == windows.min(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        monotony[6:] = np.where(identical, 10.0, windows.mean(axis=1) / std)
+    strain[6:] = windows.sum(axis=1) * monotony[6:]
+    return monotony, strain
+
+
+def _fill_date_gaps(sorted_data: list[tuple[date, float]]) -> list[tuple[date, float]]:
+    """Fill gaps in the date series with zero TSS values.
+
+    The input must already be sorted by date.
+    """
+    if not sorted_data:
         return []
 
     result = []
-    sorted_data = sorted(daily_tss, key=lambda x: x[0])
 
-    # Create a dict for quick lookup
-    tss_by_date = {d: t for d, t in sorted_data}
-
-    # Fill from first to last date
+    # Fill from first to last date, merging with the sorted data in one pass
     current = sorted_data[0][0]
     end = sorted_data[-1][0]
+    one_day = timedelta(days=1)
+    j = 0
+    n = len(sorted_data)
 
     while current <= end:
-        tss = tss_by_date.get(current, 0.0)
+        tss = 0.0
+        # Duplicate dates keep the last value
+        while j < n and sorted_data[j][0] == current:
+            tss = sorted_data[j][1]
+            j += 1
         result.append((current, tss))
-        current += timedelta(days=1)
+        current += one_day
 
     return result
 
@@ -130,16 +210,7 @@ def get_form_status(tsb: float) -> tuple[str, str]:
     Returns:
         Tuple of (status_name, status_color)
     """
-    if tsb > 25:
-        return "Transition", "yellow"
-    elif tsb > 5:
-        return "Fresh", "green"
-    elif tsb > -10:
-        return "Neutral", "blue"
-    elif tsb > -30:
-        return "Tired", "orange"
-    else:
-        return "Exhausted", "red"
+    return _FORM_STATUSES[bisect_left(_FORM_THRESHOLDS, tsb)]
 
 
 def get_ramp_rate(tss_history: list[float], weeks: int = 4) -> Optional[float]:
@@ -147,26 +218,21 @@ def get_ramp_rate(tss_history: list[float], weeks: int = 4) -> Optional[float]:
 
     Returns the average week-over-week percentage change in TSS.
     """
-    if len(tss_history) < weeks * 7:
+    # Fewer than two weeks leaves no week-over-week change to average
+    if weeks < 2 or len(tss_history) < weeks * 7:
         return None
 
-    weekly_totals = []
-    for i in range(weeks):
-        start_idx = -(i + 1) * 7
-        end_idx = -i * 7 if i > 0 else None
-        week_tss = sum(tss_history[start_idx:end_idx])
-        weekly_totals.append(week_tss)
+    # Weekly totals, most recent week first
+    recent = np.asarray(tss_history[-weeks * 7:], dtype=np.float64)
+    weekly_totals = recent.reshape(weeks, 7).sum(axis=1)[::-1]
 
-    # Calculate average week-over-week change
-    changes = []
-    for i in range(len(weekly_totals) - 1):
-        if weekly_totals[i + 1] > 0:
-            change = (weekly_totals[i] - weekly_totals[i + 1]) / weekly_totals[i + 1] * 100
-            changes.append(change)
-
-    if changes:
-        return round(sum(changes) / len(changes), 1)
-    return None
+    # Average week-over-week change, skipping changes from an empty week
+    current, previous = weekly_totals[:-1], weekly_totals[1:]
+    valid = previous > 0
+    if not valid.any():
+        return None
+    changes = (current[valid] - previous[valid]) / previous[valid] * 100
+    return round(float(changes.mean()), 1)
 
 
 def check_overtraining_risk(atl: float, ctl: float, tsb: float) -> list[str]:
@@ -214,17 +280,7 @@ def calculate_acwr(atl: float, ctl: float) -> tuple[Optional[float], ACWRZone]:
         return None, ACWRZone.UNDERTRAINED
 
     acwr = atl / ctl
-
-    if acwr < 0.8:
-        zone = ACWRZone.UNDERTRAINED
-    elif acwr <= 1.3:
-        zone = ACWRZone.OPTIMAL
-    elif acwr <= 1.5:
-        zone = ACWRZone.CAUTION
-    else:
-        zone = ACWRZone.DANGER
-
-    return round(acwr, 2), zone
+    return round(acwr, 2), _ACWR_ZONES[bisect_left(_ACWR_THRESHOLDS, acwr)]
 
 
 def calculate_monotony_strain(tss_7day: list[float]) -> tuple[Optional[float], Optional[float]]:
@@ -253,22 +309,20 @@ def calculate_monotony_strain(tss_7day: list[float]) -> tuple[Optional[float], O
     # Use the last 7 days
     last_7 = tss_7day[-7:]
 
-    try:
-        avg_tss = mean(last_7)
-        std_tss = stdev(last_7)
+    total_tss = sum(last_7)
+    avg_tss = total_tss / 7
 
-        if std_tss == 0:
-            # All days identical = infinite monotony, cap at high value
-            monotony = 10.0
-        else:
-            monotony = avg_tss / std_tss
+    if max(last_7) == min(last_7):
+        # All days identical = infinite monotony, cap at high value
+        monotony = 10.0
+    else:
+        # Sample standard deviation (n - 1), two-pass like the daily series
+        variance = sum((tss - avg_tss) ** 2 for tss in last_7) / 6
+        monotony = avg_tss / math.sqrt(variance)
 
-        total_tss = sum(last_7)
-        strain = total_tss * monotony
+    strain = total_tss * monotony
 
-        return round(monotony, 2), round(strain, 0)
-    except Exception:
-        return None, None
+    return round(monotony, 2), round(strain, 0)
 
 
 def get_monotony_status(monotony: Optional[float]) -> tuple[str, str]:
@@ -279,12 +333,7 @@ def get_monotony_status(monotony: Optional[float]) -> tuple[str, str]:
     """
     if monotony is None:
         return "Unknown", "gray"
-    elif monotony > 2.0:
-        return "High Risk", "red"
-    elif monotony > 1.5:
-        return "Elevated", "orange"
-    else:
-        return "Good", "green"
+    return _MONOTONY_STATUSES[bisect_left(_MONOTONY_THRESHOLDS, monotony)]
 
 
 def get_strain_status(strain: Optional[float]) -> tuple[str, str]:
@@ -295,14 +344,7 @@ def get_strain_status(strain: Optional[float]) -> tuple[str, str]:
     """
     if strain is None:
         return "Unknown", "gray"
-    elif strain > 6000:
-        return "Very High", "red"
-    elif strain > 4000:
-        return "High", "orange"
-    elif strain > 2000:
-        return "Moderate", "yellow"
-    else:
-        return "Low", "green"
+    return _STRAIN_STATUSES[bisect_left(_STRAIN_THRESHOLDS, strain)]
 
 
 def get_acwr_status(acwr: Optional[float]) -> tuple[str, str]:
@@ -313,11 +355,4 @@ def get_acwr_status(acwr: Optional[float]) -> tuple[str, str]:
     """
     if acwr is None:
         return "Unknown", "gray"
-    elif acwr < 0.8:
-        return "Undertrained", "yellow"
-    elif acwr <= 1.3:
-        return "Optimal", "green"
-    elif acwr <= 1.5:
-        return "Caution", "orange"
-    else:
-        return "Danger", "red"
+    return _ACWR_STATUSES[bisect_left(_ACWR_THRESHOLDS, acwr)]
@@ -1,7 +1,10 @@
 """Training Stress Score (TSS) calculations."""
 
 from enum import Enum
-from typing import Optional
+from operator import attrgetter
+from typing import Optional, Sequence
+
+import numpy as np
 
 from ..database.models import Activity, UserProfile
 
@@ -15,6 +18,20 @@ class TSSMethod(Enum):
     DURATION = "duration"  # Fallback based on duration only
 
 
+# Assumed intensity factors for the duration-only fallback, by activity type
+DURATION_INTENSITY = {
+    "strength": 0.6,
+    "yoga": 0.4,
+    "walk": 0.5,
+    "cardio": 0.75,
+    "hike": 0.65,
+    "other": 0.6,
+}
+
+# Moderate effort assumption for any other activity type
+DEFAULT_DURATION_INTENSITY = 0.7
+
+
 def calculate_tss(
     activity: Activity,
     profile: UserProfile,
@@ -25,28 +42,89 @@ def calculate_tss(
     Returns:
         Tuple of (tss, method_used, intensity_factor)
     """
-    # Try power-based TSS first (most accurate for cycling)
-    if activity.activity_type == "cycle" and activity.avg_power and activity.avg_power > 0:
-        tss, if_value = _calculate_power_tss(activity, profile)
-        return tss, TSSMethod.POWER, if_value
+    # Dispatch on sport first so each path only checks the data it can use
+    tss_for_sport = _SPORT_TSS.get(activity.activity_type, _hr_or_duration_tss)
+    return tss_for_sport(activity, profile)
 
-    # Try heart rate TSS for activities with HR data
-    if activity.avg_hr and activity.avg_hr > 0:
-        tss, if_value = _calculate_hr_tss(activity, profile)
-        return tss, TSSMethod.HEART_RATE, if_value
 
-    # Try pace-based TSS for running/swimming
-    if activity.activity_type == "run" and activity.distance_meters and activity.distance_meters > 0:
-        tss, if_value = _calculate_run_pace_tss(activity, profile)
-        return tss, TSSMethod.PACE, if_value
+# Numeric Activity fields read by calculate_tss_batch, in unpacking order
+_batch_fields = attrgetter("duration_seconds", "distance_meters", "avg_hr", "avg_power", "normalized_power")
 
-    if activity.activity_type == "swim" and activity.distance_meters and activity.distance_meters > 0:
-        tss, if_value = _calculate_swim_pace_tss(activity, profile)
-        return tss, TSSMethod.PACE, if_value
+# Method values indexed by the method codes used in calculate_tss_batch
+_BATCH_METHODS = np.array([method.value for method in (
+    TSSMethod.POWER, TSSMethod.HEART_RATE, TSSMethod.PACE, TSSMethod.DURATION
+)])
 
-    # Fallback: duration-based estimate
-    tss, if_value = _calculate_duration_tss(activity)
-    return tss, TSSMethod.DURATION, if_value
+
+def calculate_tss_batch(
+    activities: Sequence[Activity],
+    profile: UserProfile,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate TSS for many activities at once.
+
+    Gives the same results as calling calculate_tss for each activity: the
+    same method priority (power, heart rate, pace, duration) is applied
+    with boolean masks over per-field arrays, and the final values are
+    rounded with round() like the scalar helpers.
+
+    Returns:
+        Tuple of (tss array, method value array, intensity factor array);
+        method values are the stored TSSMethod strings ("power", "hr", ...)
+    """
+    n = len(activities)
+    if n == 0:
+        return np.empty(0), _BATCH_METHODS[:0], np.empty(0)
+
+    # One pass over the models; missing values and zeros behave the same in every branch
+    types = np.array([a.activity_type for a in activities])
+    values = np.array([[value or 0.0 for value in _batch_fields(a)] for a in activities], dtype=np.float64)
+    duration, distance, avg_hr, avg_power, normalized_power = values.T
+
+    # Method selection, in calculate_tss priority order
+    use_power = (types == "cycle") & (avg_power > 0)
+    use_hr = ~use_power & (avg_hr > 0)
+    remaining = ~(use_power | use_hr)
+    use_run_pace = remaining & (types == "run") & (distance > 0)
+    use_swim_pace = remaining & ~use_run_pace & (types == "swim") & (distance > 0)
+    use_duration = remaining & ~(use_run_pace | use_swim_pace)
+
+    intensity = np.zeros(n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if profile.ftp > 0:
+            power = np.where(normalized_power != 0, normalized_power, avg_power)
+            mask = use_power & (power > 0)
+            intensity[mask] = power[mask] / profile.ftp
+
+        if profile.lthr > 0:
+            intensity[use_hr] = avg_hr[use_hr] / profile.lthr
+
+        duration_minutes = duration / 60
+        for mask, threshold_pace, pace_distance in (
+            (use_run_pace, profile.threshold_pace_minkm, distance / 1000),
+            (use_swim_pace, profile.swim_threshold_pace, distance / 100),
+        ):
+            if threshold_pace > 0:
+                actual_pace = duration_minutes / pace_distance
+                mask = mask & (actual_pace > 0)
+                intensity[mask] = np.minimum(threshold_pace / actual_pace[mask], 1.5)
+
+    intensity[use_duration] = [
+        DURATION_INTENSITY.get(t, DEFAULT_DURATION_INTENSITY) for t in types[use_duration].tolist()
+    ]
+
+    duration_hours = duration / 3600
+    tss = duration_hours * intensity * intensity * 100
+
+    codes = np.select([use_power, use_hr, use_run_pace | use_swim_pace], [0, 1, 2], default=3)
+    methods = _BATCH_METHODS[codes]
+
+    # Round like the scalar helpers: np.round scales by 10**decimals first,
+    # which can land ties on the other side of round()
+    return (
+        np.array([round(value, 1) for value in tss.tolist()]),
+        methods,
+        np.array([round(value, 3) for value in intensity.tolist()]),
+    )
 
 
 def _calculate_power_tss(activity: Activity, profile: UserProfile) -> tuple[float, float]:
@@ -170,23 +248,56 @@ def _calculate_duration_tss(activity: Activity) -> tuple[float, float]:
 
     Assumes moderate intensity (IF = 0.7) for activities without other metrics.
     """
-    # Moderate effort assumption
-    intensity_factor = 0.7
-
-    # Adjust based on activity type
-    activity_intensity = {
-        "strength": 0.6,
-        "yoga": 0.4,
-        "walk": 0.5,
-        "cardio": 0.75,
-        "hike": 0.65,
-        "other": 0.6,
-    }
-
-    if activity.activity_type in activity_intensity:
-        intensity_factor = activity_intensity[activity.activity_type]
+    intensity_factor = DURATION_INTENSITY.get(activity.activity_type, DEFAULT_DURATION_INTENSITY)
 
     duration_hours = activity.duration_seconds / 3600
     tss = duration_hours * intensity_factor * intensity_factor * 100
 
     return round(tss, 1), round(intensity_factor, 3)
+
+
+def _hr_or_duration_tss(activity: Activity, profile: UserProfile) -> tuple[float, TSSMethod, float]:
+    """Heart rate TSS when HR data exists, otherwise the duration-based estimate."""
+    if activity.avg_hr and activity.avg_hr > 0:
+        tss, if_value = _calculate_hr_tss(activity, profile)
+        return tss, TSSMethod.HEART_RATE, if_value
+
+    tss, if_value = _calculate_duration_tss(activity)
+    return tss, TSSMethod.DURATION, if_value
+
+
+def _cycle_tss(activity: Activity, profile: UserProfile) -> tuple[float, TSSMethod, float]:
+    """Power TSS first (most accurate for cycling), then HR, then duration."""
+    if activity.avg_power and activity.avg_power > 0:
+        tss, if_value = _calculate_power_tss(activity, profile)
+        return tss, TSSMethod.POWER, if_value
+
+    return _hr_or_duration_tss(activity, profile)
+
+
+def _run_tss(activity: Activity, profile: UserProfile) -> tuple[float, TSSMethod, float]:
+    """HR TSS first, then run pace when distance is known, then duration."""
+    has_hr = activity.avg_hr and activity.avg_hr > 0
+    if not has_hr and activity.distance_meters and activity.distance_meters > 0:
+        tss, if_value = _calculate_run_pace_tss(activity, profile)
+        return tss, TSSMethod.PACE, if_value
+
+    return _hr_or_duration_tss(activity, profile)
+
+
+def _swim_tss(activity: Activity, profile: UserProfile) -> tuple[float, TSSMethod, float]:
+    """HR TSS first, then swim pace when distance is known, then duration."""
+    has_hr = activity.avg_hr and activity.avg_hr > 0
+    if not has_hr and activity.distance_meters and activity.distance_meters > 0:
+        tss, if_value = _calculate_swim_pace_tss(activity, profile)
+        return tss, TSSMethod.PACE, if_value
+
+    return _hr_or_duration_tss(activity, profile)
+
+
+# TSS strategy per activity type; other types use HR or duration only
+_SPORT_TSS = {
+    "cycle": _cycle_tss,
+    "run": _run_tss,
+    "swim": _swim_tss,
+}